@@ -0,0 +1,64 @@
+import asyncio
+
+import queries
+from db import get_async_pool
+
+
+async def run_query(sql, *args):
+    pool = await get_async_pool()
+    async with pool.connection() as conn:
+        records = await conn.fetch(sql, *args)
+    return [dict(r) for r in records]
+
+
+async def get_teams(fields=queries.DEFAULT_TEAM_FIELDS, limit=None, after=queries.FIRST_PAGE):
+    return await run_query(queries.teams_page(tuple(fields)), after[0], after[1], limit)
+
+
+async def get_players(fields=queries.DEFAULT_PLAYER_FIELDS, limit=None, after=queries.FIRST_PAGE):
+    return await run_query(queries.players_page(tuple(fields)), after[0], after[1], limit)
+
+
+async def search_players(q, limit=20):
+    return await run_query(queries.SEARCH_PLAYERS, queries.escape_like(q), limit)
+
+
+async def get_player(player_id):
+    return await run_query(queries.GET_PLAYER, player_id)
+
+
+async def get_squads(team_id, season):
+    return await run_query(queries.GET_SQUADS, team_id, season)
+
+
+async def get_team_league(team_id, season):
+    return await run_query(queries.GET_TEAM_LEAGUE, team_id, season)
+
+
+async def get_top_players(team_id, season):
+    return await run_query(queries.GET_TOP_PLAYERS, team_id, season)
+
+
+async def get_player_stats(player_id):
+    return await run_query(queries.GET_PLAYER_STATS, player_id)
+
+
+async def get_team_page(team_id, season):
+    league, squad, top_players = await asyncio.gather(
+        get_team_league(team_id, season),
+        get_squads(team_id, season),
+        get_top_players(team_id, season),
+    )
+    return {"league": league, "squad": squad, "top_players": top_players}
+
+
+async def get_players_batch(player_ids):
+    return await run_query(queries.GET_PLAYERS_BATCH, list(player_ids))
+
+
+async def get_player_stats_batch(player_ids):
+    return await run_query(queries.GET_PLAYER_STATS_BATCH, list(player_ids))
+
+
+async def get_data_version():
+    return await run_query(queries.GET_DATA_VERSION)
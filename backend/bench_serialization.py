@@ -0,0 +1,113 @@
+"""
+Serialization benchmark for the API response path.
+
+Compares the old path (cursor rows -> DataFrame -> to_dict -> jsonable_encoder
+-> json) with the current one (cursor rows -> dicts -> orjson) on synthetic
+result sets shaped like /players and /player-stats/{player_id}. No database
+is needed; the numbers are process CPU time per request.
+
+Usage:
+    python bench_serialization.py [--players 20000] [--matches 120] [--repeat 50]
+"""
+
+import argparse
+import json
+import random
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pandas as pd
+from fastapi.encoders import jsonable_encoder
+
+from serialization import dumps
+
+PLAYERS_COLUMNS = ["player_id", "player_name"]
+
+PLAYER_STATS_COLUMNS = [
+    "game_date", "season", "league", "club_name", "opponent_name", "home_away",
+    "goals_for", "goals_against", "result", "goals", "assists", "yellow",
+    "yellow_red", "red", "start_eleven", "minutes", "on_min", "off_min", "rating",
+]
+
+
+def make_players_rows(n):
+    return [(100000 + i, f"Player {i:06d}") for i in range(n)]
+
+
+def make_player_stats_rows(n):
+    rows = []
+    start = date(2020, 8, 1)
+    for i in range(n):
+        goals_for, goals_against = random.randint(0, 4), random.randint(0, 4)
+        rows.append((
+            start + timedelta(days=7 * i),
+            "24/25",
+            "1_liga_gr_3",
+            "FC Example",
+            f"Opponent {i % 16}",
+            "home" if i % 2 else "away",
+            goals_for,
+            goals_against,
+            "Win" if goals_for > goals_against else "Draw" if goals_for == goals_against else "Loss",
+            random.randint(0, 2),
+            random.randint(0, 1),
+            bool(i % 7 == 0),
+            False,
+            False,
+            bool(i % 3),
+            random.randint(1, 90),
+            None if i % 3 else random.randint(46, 85),
+            None,
+            float(Decimal("6.5") + Decimal(i % 10) / 10),
+        ))
+    return rows
+
+
+def pandas_path(columns, rows):
+    df = pd.DataFrame.from_records(rows, columns=columns)
+    content = jsonable_encoder(df.to_dict(orient="records"))
+    return json.dumps(content, ensure_ascii=False, allow_nan=False).encode("utf-8")
+
+
+def direct_path(columns, rows):
+    return dumps([dict(zip(columns, row)) for row in rows])
+
+
+def cpu_per_call(fn, columns, rows, repeat):
+    fn(columns, rows)
+    started = time.process_time()
+    for _ in range(repeat):
+        fn(columns, rows)
+    return (time.process_time() - started) / repeat
+
+
+def report(label, columns, rows, repeat):
+    old = cpu_per_call(pandas_path, columns, rows, repeat)
+    new = cpu_per_call(direct_path, columns, rows, repeat)
+    print(
+        f"{label:<28} rows={len(rows):>6}  "
+        f"pandas={old * 1000:8.3f} ms  direct={new * 1000:8.3f} ms  "
+        f"saved={(old - new) * 1000:8.3f} ms ({old / new:5.1f}x)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--players", type=int, default=20000)
+    parser.add_argument("--matches", type=int, default=120)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    random.seed(0)
+    report("/players", PLAYERS_COLUMNS, make_players_rows(args.players), args.repeat)
+    report(
+        "/player-stats/{player_id}",
+        PLAYER_STATS_COLUMNS,
+        make_player_stats_rows(args.matches),
+        args.repeat,
+    )
+
+
+if __name__ == "__main__":
+    main()
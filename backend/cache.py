@@ -0,0 +1,120 @@
+import hashlib
+import time
+from collections import OrderedDict
+from email.utils import format_datetime, parsedate_to_datetime
+
+
+class CachedResponse:
+    def __init__(self, body, version, updated_at, extra_headers=None):
+        self.body = body
+        self.version = version
+        self.extra_headers = extra_headers or {}
+        self.created_at = time.monotonic()
+
+        digest = hashlib.sha1(body).hexdigest()[:16]
+        self.etag = f'"{version}-{digest}"'
+        self.last_modified = updated_at.replace(microsecond=0) if updated_at else None
+
+    @property
+    def headers(self):
+        headers = {
+            "ETag": self.etag,
+            "Cache-Control": "no-cache",
+            "X-Data-Version": str(self.version),
+            **self.extra_headers,
+        }
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(self.last_modified, usegmt=True)
+        return headers
+
+    def matches(self, if_none_match, if_modified_since):
+        """Return True if the client's validators still match this body."""
+        if if_none_match:
+            tags = [t.strip() for t in if_none_match.split(",")]
+            return "*" in tags or self.etag in tags or f"W/{self.etag}" in tags
+
+        if if_modified_since and self.last_modified is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            if since.tzinfo is None:
+                return False
+            return self.last_modified <= since
+
+        return False
+
+
+class ResponseCache:
+    """
+    In-process LRU of encoded response bodies.
+
+    Entries expire after ``ttl`` seconds and are dropped as soon as a newer
+    data version is seen, so a reload of the database is picked up on the
+    next version check.
+    """
+
+    def __init__(self, maxsize=256, ttl=600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, key, version):
+        if version != self.version:
+            self._entries.clear()
+            self.version = version
+
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry.created_at >= self.ttl:
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key, body, version, updated_at, extra_headers=None):
+        entry = CachedResponse(body, version, updated_at, extra_headers)
+        if version == self.version:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entry
+
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.maxsize,
+            "ttl_s": self.ttl,
+            "version": self.version,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class DataVersion:
+    """Reads the data_version stamp at most once per ``check_interval`` seconds."""
+
+    def __init__(self, loader, check_interval=10.0):
+        self._loader = loader
+        self.check_interval = check_interval
+        self.version = None
+        self.updated_at = None
+        self._checked_at = 0.0
+
+    async def current(self):
+        now = time.monotonic()
+        if self.version is None or now - self._checked_at >= self.check_interval:
+            rows = await self._loader()
+            if rows:
+                self.version = rows[0]["version"]
+                self.updated_at = rows[0]["updated_at"]
+            else:
+                self.version, self.updated_at = 0, None
+            self._checked_at = now
+        return self.version, self.updated_at
@@ -0,0 +1,180 @@
+import asyncio
+import os
+import threading
+import time
+from contextlib import asynccontextmanager
+
+import asyncpg
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def _env_int(name, default):
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def _env_float(name, default):
+    value = os.getenv(name)
+    return float(value) if value else default
+
+
+def connection_params():
+    port = os.getenv("DB_PORT")
+    return {
+        "host": os.getenv("DB_HOST"),
+        "database": os.getenv("DB_NAME"),
+        "user": os.getenv("DB_USER"),
+        "password": os.getenv("DB_PASSWORD"),
+        "port": int(port) if port else None,
+    }
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+class PoolMetrics:
+    """Thread-safe counters describing how the pool is used."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checked_out = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.timeouts = 0
+
+    def add(self, **deltas):
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self, name, getattr(self, name) + delta)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "checked_out": self.checked_out,
+                "waits": self.waits,
+                "wait_time_s": round(self.wait_time, 6),
+                "avg_wait_ms": round(self.wait_time / self.waits * 1000, 3) if self.waits else 0.0,
+                "timeouts": self.timeouts,
+            }
+
+
+class AsyncConnectionPool:
+    """
+    Bounded asyncpg pool with checkout metrics.
+
+    asyncpg recycles connections itself: ``max_queries`` replaces a connection
+    after that many queries and ``recycle_seconds`` closes idle ones.
+    Broken connections are detected and replaced on acquire. Each connection
+    keeps up to ``statement_cache_size`` prepared statements.
+    """
+
+    def __init__(
+        self,
+        minconn=1,
+        maxconn=10,
+        recycle_seconds=1800.0,
+        timeout=30.0,
+        max_queries=50000,
+        statement_cache_size=100,
+        params=None,
+    ):
+        if maxconn < 1 or minconn > maxconn:
+            raise ValueError(f"invalid pool size: min={minconn}, max={maxconn}")
+
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.recycle_seconds = recycle_seconds
+        self.timeout = timeout
+        self.max_queries = max_queries
+        self.statement_cache_size = statement_cache_size
+        self.params = params or connection_params()
+        self.metrics = PoolMetrics()
+        self._pool = None
+
+    async def open(self):
+        if self._pool is None:
+            self._pool = await asyncpg.create_pool(
+                min_size=self.minconn,
+                max_size=self.maxconn,
+                max_queries=self.max_queries,
+                max_inactive_connection_lifetime=self.recycle_seconds,
+                statement_cache_size=self.statement_cache_size,
+                **self.params,
+            )
+        return self
+
+    @asynccontextmanager
+    async def connection(self):
+        if self._pool is None:
+            await self.open()
+
+        started = time.monotonic()
+        must_wait = self._pool.get_idle_size() == 0 and self._pool.get_size() >= self.maxconn
+
+        try:
+            conn = await self._pool.acquire(timeout=self.timeout)
+        except asyncio.TimeoutError:
+            self.metrics.add(timeouts=1, waits=1, wait_time=time.monotonic() - started)
+            raise PoolTimeout(f"no connection available after {self.timeout}s")
+
+        if must_wait:
+            self.metrics.add(waits=1, wait_time=time.monotonic() - started)
+        self.metrics.add(checkouts=1, checked_out=1)
+
+        try:
+            yield conn
+        finally:
+            self.metrics.add(checked_out=-1)
+            await self._pool.release(conn)
+
+    def stats(self):
+        size = self._pool.get_size() if self._pool is not None else 0
+        idle = self._pool.get_idle_size() if self._pool is not None else 0
+
+        return {
+            "size": size,
+            "idle": idle,
+            "min_size": self.minconn,
+            "max_size": self.maxconn,
+            **self.metrics.snapshot(),
+        }
+
+    async def close(self):
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+
+_async_pool = None
+
+
+def pool_stats():
+    return _async_pool.stats() if _async_pool is not None else {}
+
+
+async def get_async_pool():
+    global _async_pool
+
+    if _async_pool is None:
+        _async_pool = AsyncConnectionPool(
+            minconn=_env_int("DB_POOL_MIN", 1),
+            maxconn=_env_int("DB_POOL_MAX", 10),
+            recycle_seconds=_env_float("DB_POOL_RECYCLE", 1800.0),
+            timeout=_env_float("DB_POOL_TIMEOUT", 30.0),
+            max_queries=_env_int("DB_POOL_MAX_QUERIES", 50000),
+            statement_cache_size=_env_int("DB_STATEMENT_CACHE_SIZE", 100),
+        )
+    return await _async_pool.open()
+
+
+async def close_async_pool():
+    global _async_pool
+
+    if _async_pool is not None:
+        await _async_pool.close()
+        _async_pool = None
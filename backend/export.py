@@ -0,0 +1,178 @@
+"""
+Streaming columnar exports for analysts.
+
+Rows are read through a server-side cursor, converted to Arrow record batches
+of ``chunk_size`` rows and written as an Arrow IPC stream or as Parquet row
+groups. Every chunk is compressed and yielded as soon as it is written, so a
+full-season pull keeps at most one chunk in server memory.
+"""
+
+import zlib
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import queries
+from db import get_async_pool
+
+try:
+    import zstandard
+except ImportError:  # zstd is optional, gzip is always available
+    zstandard = None
+
+
+DATASETS = {
+    "matches": (
+        queries.EXPORT_MATCHES,
+        pa.schema([
+            ("match_id", pa.int32()),
+            ("season", pa.string()),
+            ("game_date", pa.date32()),
+            ("league", pa.string()),
+            ("home_club_id", pa.int32()),
+            ("away_club_id", pa.int32()),
+            ("home_goals", pa.int32()),
+            ("away_goals", pa.int32()),
+        ]),
+    ),
+    "player_stats": (
+        queries.EXPORT_PLAYER_STATS,
+        pa.schema([
+            ("player_id", pa.int32()),
+            ("match_id", pa.int32()),
+            ("club_id", pa.int32()),
+            ("season", pa.string()),
+            ("goals", pa.int32()),
+            ("assists", pa.int32()),
+            ("yellow", pa.bool_()),
+            ("yellow_red", pa.bool_()),
+            ("red", pa.bool_()),
+            ("start_eleven", pa.bool_()),
+            ("minutes", pa.int32()),
+            ("on_min", pa.int32()),
+            ("off_min", pa.int32()),
+            ("team_goals", pa.int32()),
+            ("team_conceded", pa.int32()),
+            ("rating", pa.float64()),
+        ]),
+    ),
+}
+
+FORMATS = {
+    "arrow": ("application/vnd.apache.arrow.stream", "arrows"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+
+class _ChunkSink:
+    """Write-only file object that hands out what was written since the last drain."""
+
+    def __init__(self):
+        self._parts = []
+        self.closed = False
+
+    def write(self, data):
+        self._parts.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self):
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+
+class _Identity:
+    def compress(self, data):
+        return data
+
+    def flush(self):
+        return b""
+
+
+def _accepted_codings(accept_encoding):
+    accepted = {}
+    for part in (accept_encoding or "").split(","):
+        coding, *params = [p.strip() for p in part.split(";")]
+        if not coding:
+            continue
+
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+
+        if q > 0:
+            accepted[coding.lower()] = q
+    return accepted
+
+
+def choose_encoding(accept_encoding, fmt=None):
+    # Parquet pages are already snappy-compressed; a second pass only costs CPU.
+    if fmt == "parquet":
+        return None
+
+    accepted = _accepted_codings(accept_encoding)
+    # Highest q wins; on a tie zstd beats gzip.
+    supported = ("zstd", "gzip") if zstandard is not None else ("gzip",)
+    candidates = [(accepted[c], -rank, c) for rank, c in enumerate(supported) if c in accepted]
+    return max(candidates)[2] if candidates else None
+
+
+def _compressor(encoding):
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=3).compressobj()
+    if encoding == "gzip":
+        return zlib.compressobj(6, zlib.DEFLATED, 31)
+    return _Identity()
+
+
+def _open_writer(fmt, sink, schema):
+    if fmt == "parquet":
+        return pq.ParquetWriter(pa.PythonFile(sink, mode="w"), schema, compression="snappy")
+    return pa.ipc.new_stream(pa.PythonFile(sink, mode="w"), schema)
+
+
+def _write_batch(fmt, writer, rows, schema):
+    batch = pa.RecordBatch.from_pylist(rows, schema=schema)
+    if fmt == "parquet":
+        writer.write_batch(batch, row_group_size=len(rows))
+    else:
+        writer.write_batch(batch)
+
+
+async def stream_export(dataset, fmt, season=None, encoding=None, chunk_size=50000):
+    query, schema = DATASETS[dataset]
+    sink = _ChunkSink()
+    compressor = _compressor(encoding)
+    writer = _open_writer(fmt, sink, schema)
+
+    pool = await get_async_pool()
+    async with pool.connection() as conn:
+        async with conn.transaction():
+            rows = []
+            async for record in conn.cursor(query, season, prefetch=min(chunk_size, 10000)):
+                rows.append(dict(record))
+                if len(rows) >= chunk_size:
+                    _write_batch(fmt, writer, rows, schema)
+                    rows = []
+                    chunk = compressor.compress(sink.drain())
+                    if chunk:
+                        yield chunk
+
+            if rows:
+                _write_batch(fmt, writer, rows, schema)
+
+    writer.close()
+    tail = compressor.compress(sink.drain()) + compressor.flush()
+    if tail:
+        yield tail
@@ -1,43 +1,232 @@
-from fastapi import FastAPI
-import services
+import base64
+import os
+from typing import List, Optional
 
-app = FastAPI()
+import orjson
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+import async_services as services
+import db
+import export
+import migrations
+import queries
+from cache import DataVersion, ResponseCache
+from serialization import ORJSONResponse, dumps
+
+app = FastAPI(default_response_class=ORJSONResponse)
+
+MAX_BATCH_IDS = 500
+
+class BatchRequest(BaseModel):
+    ids: List[int]
+
+response_cache = ResponseCache(
+    maxsize=int(os.getenv("API_CACHE_SIZE", "256")),
+    ttl=float(os.getenv("API_CACHE_TTL", "600")),
+)
+data_version = DataVersion(
+    services.get_data_version,
+    check_interval=float(os.getenv("API_CACHE_VERSION_CHECK", "10")),
+)
+
+async def cached_response(request: Request, load):
+    version, updated_at = await data_version.current()
+    key = f"{request.url.path}?{sorted(request.query_params.multi_items())}"
+
+    entry = response_cache.get(key, version)
+    if entry is None:
+        result = await load()
+        rows, extra_headers = result if isinstance(result, tuple) else (result, None)
+        entry = response_cache.put(key, dumps(rows), version, updated_at, extra_headers)
+
+    if entry.matches(
+        request.headers.get("if-none-match"),
+        request.headers.get("if-modified-since"),
+    ):
+        return Response(status_code=304, headers=entry.headers)
+
+    return Response(entry.body, media_type="application/json", headers=entry.headers)
+
+def parse_fields(fields, allowed, default):
+    if not fields:
+        return default
+
+    requested = tuple(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = [f for f in requested if f not in allowed]
+    if unknown or not requested:
+        raise HTTPException(400, f"unknown fields: {unknown}; allowed: {list(allowed)}")
+    return requested
+
+def encode_cursor(row, key):
+    raw = orjson.dumps([row[key[0]], row[key[1]]])
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor):
+    if cursor is None:
+        return queries.FIRST_PAGE
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        name, key_id = orjson.loads(raw)
+    except (ValueError, TypeError):
+        raise HTTPException(400, "invalid cursor")
+
+    if not isinstance(name, str) or not isinstance(key_id, int):
+        raise HTTPException(400, "invalid cursor")
+    return name, key_id
+
+async def cached_page(request: Request, load, key, fields, limit):
+    async def load_page():
+        rows = await load()
+
+        headers = {}
+        if limit is not None and len(rows) == limit:
+            cursor = encode_cursor(rows[-1], key)
+            next_url = request.url.include_query_params(cursor=cursor)
+            headers = {"X-Next-Cursor": cursor, "Link": f'<{next_url}>; rel="next"'}
+
+        if any(k not in fields for k in key):
+            rows = [{f: row[f] for f in fields} for row in rows]
+        return rows, headers
+
+    return await cached_response(request, load_page)
+
+def batch_ids(body: BatchRequest):
+    ids = list(dict.fromkeys(body.ids))
+    if not ids:
+        raise HTTPException(400, "ids must not be empty")
+    if len(ids) > MAX_BATCH_IDS:
+        raise HTTPException(400, f"at most {MAX_BATCH_IDS} ids per request")
+    return ids
+
+@app.on_event("startup")
+async def open_db_pool():
+    pool = await db.get_async_pool()
+    await migrations.apply_migrations(pool)
+
+@app.on_event("shutdown")
+async def close_db_pool():
+    await db.close_async_pool()
 
 @app.get("/")
-def root():
+async def root():
     return {"message": "iAM-Scout API läuft 🚀"}
 
+@app.get("/metrics/pool")
+async def api_get_pool_metrics():
+    return db.pool_stats()
+
+@app.get("/metrics/cache")
+async def api_get_cache_metrics():
+    return response_cache.stats()
+
+@app.get("/data-version")
+async def api_get_data_version():
+    version, updated_at = await data_version.current()
+    return {"version": version, "updated_at": updated_at}
+
 @app.get("/teams")
-def api_get_teams():
-    df = services.get_teams()
-    return df.to_dict(orient="records")
+async def api_get_teams(
+    request: Request,
+    fields: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    cursor: Optional[str] = None,
+):
+    selected = parse_fields(fields, queries.TEAM_FIELDS, queries.DEFAULT_TEAM_FIELDS)
+    after = decode_cursor(cursor)
+    return await cached_page(
+        request,
+        lambda: services.get_teams(selected, limit, after),
+        queries.TEAM_KEY,
+        selected,
+        limit,
+    )
 
 @app.get("/players")
-def api_get_players():
-    df = services.get_players()
-    return df.to_dict(orient="records")
+async def api_get_players(
+    request: Request,
+    fields: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    cursor: Optional[str] = None,
+):
+    selected = parse_fields(fields, queries.PLAYER_FIELDS, queries.DEFAULT_PLAYER_FIELDS)
+    after = decode_cursor(cursor)
+    return await cached_page(
+        request,
+        lambda: services.get_players(selected, limit, after),
+        queries.PLAYER_KEY,
+        selected,
+        limit,
+    )
+
+@app.get("/players/search")
+async def api_search_players(
+    request: Request,
+    q: str = Query(..., min_length=3, max_length=100),
+    limit: int = Query(20, ge=1, le=100),
+):
+    return await cached_response(request, lambda: services.search_players(q, limit))
+
+@app.post("/players:batch")
+async def api_get_players_batch(body: BatchRequest):
+    rows = await services.get_players_batch(batch_ids(body))
+    return ORJSONResponse(rows)
 
 @app.get("/players/{player_id}")
-def api_get_player(player_id: int):
-    df = services.get_player(player_id)
-    return df.to_dict(orient="records")
+async def api_get_player(request: Request, player_id: int):
+    return await cached_response(request, lambda: services.get_player(player_id))
 
 @app.get("/squads")
-def api_get_squads(team_id: int, season: str):
-    df = services.get_squads(team_id, season)
-    return df.to_dict(orient="records")
+async def api_get_squads(request: Request, team_id: int, season: str):
+    return await cached_response(request, lambda: services.get_squads(team_id, season))
 
 @app.get("/team-league")
-def api_get_team_league(team_id: int, season: str):
-    df = services.get_team_league(team_id, season)
-    return df.to_dict(orient="records")
+async def api_get_team_league(request: Request, team_id: int, season: str):
+    return await cached_response(request, lambda: services.get_team_league(team_id, season))
 
 @app.get("/top-players")
-def api_get_top_players(team_id: int, season: str):
-    df = services.get_top_players(team_id, season)
-    return df.to_dict(orient="records")
+async def api_get_top_players(request: Request, team_id: int, season: str):
+    return await cached_response(request, lambda: services.get_top_players(team_id, season))
+
+@app.get("/team-page")
+async def api_get_team_page(request: Request, team_id: int, season: str):
+    return await cached_response(request, lambda: services.get_team_page(team_id, season))
 
 @app.get("/player-stats/{player_id}")
-def api_get_player_stats(player_id: int):
-    df = services.get_player_stats(player_id)
-    return df.to_dict(orient="records")
\ No newline at end of file
+async def api_get_player_stats(request: Request, player_id: int):
+    return await cached_response(request, lambda: services.get_player_stats(player_id))
+
+@app.post("/player-stats:batch")
+async def api_get_player_stats_batch(body: BatchRequest):
+    rows = await services.get_player_stats_batch(batch_ids(body))
+    return ORJSONResponse(rows)
+
+@app.get("/export/{dataset}")
+async def api_export(
+    request: Request,
+    dataset: str,
+    fmt: str = Query("arrow", alias="format"),
+    season: Optional[str] = None,
+    chunk_size: int = Query(50000, ge=1000, le=500000),
+):
+    if dataset not in export.DATASETS:
+        raise HTTPException(404, f"unknown dataset: {dataset}; available: {list(export.DATASETS)}")
+    if fmt not in export.FORMATS:
+        raise HTTPException(400, f"unknown format: {fmt}; available: {list(export.FORMATS)}")
+
+    media_type, extension = export.FORMATS[fmt]
+    encoding = export.choose_encoding(request.headers.get("accept-encoding"), fmt)
+
+    headers = {
+        "Content-Disposition": f'attachment; filename="{dataset}.{extension}"',
+        "Vary": "Accept-Encoding",
+    }
+    if encoding:
+        headers["Content-Encoding"] = encoding
+
+    return StreamingResponse(
+        export.stream_export(dataset, fmt, season, encoding, chunk_size),
+        media_type=media_type,
+        headers=headers,
+    )
\ No newline at end of file
@@ -0,0 +1,28 @@
+import os
+from pathlib import Path
+
+SQL_DIR = Path(
+    os.getenv("DB_SQL_DIR", Path(__file__).resolve().parent.parent / "containers" / "database" / "sql")
+)
+
+# Idempotent scripts that add objects created after the initial schema. The
+# initdb scripts only run on an empty volume, so the API applies these on
+# startup to migrate existing databases.
+MIGRATIONS = (
+    "08_derived_tables.sql",
+    "10_player_search.sql",
+    "11_query_indexes.sql",
+)
+
+# Serializes concurrent API workers starting against the same database.
+MIGRATION_LOCK_ID = 0x69414D
+
+
+async def apply_migrations(pool):
+    scripts = [(SQL_DIR / name).read_text(encoding="utf-8") for name in MIGRATIONS]
+
+    async with pool.connection() as conn:
+        async with conn.transaction():
+            await conn.execute("SELECT pg_advisory_xact_lock($1)", MIGRATION_LOCK_ID)
+            for script in scripts:
+                await conn.execute(script)
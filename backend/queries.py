@@ -0,0 +1,201 @@
+"""
+SQL statements used by the service layer.
+
+Every statement uses positional ``$n`` placeholders; asyncpg's
+``conn.fetch(sql, ...)`` prepares it server-side through the per-connection
+statement cache, keyed by the statement text.
+
+Paged list queries are generated per requested column set from fixed column
+whitelists and memoized, so each projection is prepared like any other query.
+"""
+
+import functools
+
+
+TEAM_FIELDS = ("club_id", "club_name", "plz", "location")
+TEAM_KEY = ("club_name", "club_id")
+DEFAULT_TEAM_FIELDS = ("club_id", "club_name")
+
+PLAYER_FIELDS = ("player_id", "player_name", "nationality", "date_of_birth", "height", "position")
+PLAYER_KEY = ("player_name", "player_id")
+DEFAULT_PLAYER_FIELDS = ("player_id", "player_name")
+
+FIRST_PAGE = ("", -1)
+
+
+def escape_like(text):
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _page_query(table, all_fields, key, fields):
+    # Keyset pagination on (name, id). FIRST_PAGE sorts before every row and
+    # a NULL limit returns all rows.
+    columns = [f for f in all_fields if f in fields or f in key]
+
+    return f"""
+        SELECT {", ".join(columns)}
+        FROM {table}
+        WHERE ({key[0]}, {key[1]}) > ($1, $2)
+        ORDER BY {key[0]}, {key[1]}
+        LIMIT $3
+    """
+
+
+@functools.lru_cache(maxsize=None)
+def teams_page(fields):
+    return _page_query("clubs", TEAM_FIELDS, TEAM_KEY, fields)
+
+
+@functools.lru_cache(maxsize=None)
+def players_page(fields):
+    return _page_query("players", PLAYER_FIELDS, PLAYER_KEY, fields)
+
+
+SEARCH_PLAYERS = """
+        SELECT player_id, player_name, date_of_birth
+        FROM players
+        WHERE player_name ILIKE '%' || $1 || '%'
+        ORDER BY player_name ILIKE $1 || '%' DESC, player_name, player_id
+        LIMIT $2
+    """
+
+GET_PLAYER = """
+        SELECT player_name, nationality, date_of_birth, height, position
+        FROM players
+        WHERE player_id = $1
+    """
+
+GET_SQUADS = """
+        SELECT
+            p.player_name,
+            p.position
+        FROM squads s
+        JOIN players p
+            ON s.player_id = p.player_id
+        WHERE s.club_id = $1
+        AND s.season = $2
+        ORDER BY p.position
+    """
+
+GET_TEAM_LEAGUE = """
+        SELECT *
+        FROM clubs_per_season
+        WHERE club_id = $1
+        AND season = $2
+    """
+
+GET_TOP_PLAYERS = """
+        SELECT
+            p.player_name,
+            s.rated_games AS games,
+            ROUND(s.avg_rating::numeric, 1) AS avg_rating
+        FROM player_season_stats s
+        JOIN players p
+            ON s.player_id = p.player_id
+        WHERE s.club_id = $1
+          AND s.season = $2
+          AND s.rated_games > 0
+        ORDER BY avg_rating DESC
+    """
+
+GET_PLAYER_STATS = """
+        SELECT
+            game_date,
+            season,
+            league,
+            club_name,
+            opponent_name,
+            home_away,
+            goals_for,
+            goals_against,
+            result,
+            goals,
+            assists,
+            yellow,
+            yellow_red,
+            red,
+            start_eleven,
+            minutes,
+            on_min,
+            off_min,
+            rating
+        FROM player_match_log
+        WHERE player_id = $1
+        ORDER BY game_date DESC
+    """
+
+GET_PLAYERS_BATCH = """
+        SELECT player_id, player_name, nationality, date_of_birth, height, position
+        FROM players
+        WHERE player_id = ANY($1)
+        ORDER BY player_id
+    """
+
+GET_PLAYER_STATS_BATCH = """
+        SELECT
+            player_id,
+            game_date,
+            season,
+            league,
+            club_name,
+            opponent_name,
+            home_away,
+            goals_for,
+            goals_against,
+            result,
+            goals,
+            assists,
+            yellow,
+            yellow_red,
+            red,
+            start_eleven,
+            minutes,
+            on_min,
+            off_min,
+            rating
+        FROM player_match_log
+        WHERE player_id = ANY($1)
+        ORDER BY player_id, game_date DESC
+    """
+
+EXPORT_MATCHES = """
+        SELECT
+            match_id,
+            season,
+            game_date,
+            league,
+            home_club_id,
+            away_club_id,
+            home_goals,
+            away_goals
+        FROM matches
+        WHERE $1::text IS NULL OR season = $1
+        ORDER BY match_id
+    """
+
+EXPORT_PLAYER_STATS = """
+        SELECT
+            ps.player_id,
+            ps.match_id,
+            ps.club_id,
+            m.season,
+            ps.goals,
+            ps.assists,
+            ps.yellow,
+            ps.yellow_red,
+            ps.red,
+            ps.start_eleven,
+            ps.minutes,
+            ps.on_min,
+            ps.off_min,
+            ps.team_goals,
+            ps.team_conceded,
+            ps.rating
+        FROM player_stats ps
+        JOIN matches m
+            ON ps.match_id = m.match_id
+        WHERE $1::text IS NULL OR m.season = $1
+        ORDER BY ps.match_id, ps.player_id
+    """
+
+GET_DATA_VERSION = "SELECT version, updated_at FROM data_version"
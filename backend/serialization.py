@@ -0,0 +1,23 @@
+from decimal import Decimal
+
+import orjson
+from fastapi.responses import Response
+
+
+def _default(obj):
+    # NUMERIC columns (height, avg_rating) arrive as Decimal; the old
+    # pandas/jsonable_encoder path rendered them as floats as well.
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(content):
+    return orjson.dumps(content, default=_default)
+
+
+class ORJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content):
+        return dumps(content)
@@ -104,7 +104,4 @@
     );
 
     CREATE INDEX idx_player_stats_match
-    ON player_stats(match_id);
-
-    CREATE INDEX idx_player_stats_club
-    ON player_stats(club_id);
\ No newline at end of file
+    ON player_stats(match_id);
\ No newline at end of file
@@ -0,0 +1,119 @@
+    -- Derived tables read by the API. Created after the load scripts so the
+    -- first build already sees all data; rebuilt by refresh_aggregates().
+    -- Idempotent: the API applies this file again at startup, which migrates
+    -- databases whose volume predates it.
+
+    -- Per player, club and season aggregate used by /top-players.
+    CREATE MATERIALIZED VIEW IF NOT EXISTS player_season_stats AS
+    SELECT
+        ps.player_id,
+        ps.club_id,
+        m.season,
+        COUNT(*) AS games,
+        SUM(ps.minutes) AS minutes,
+        SUM(ps.goals) AS goals,
+        SUM(ps.assists) AS assists,
+        COUNT(ps.rating) AS rated_games,
+        AVG(ps.rating) AS avg_rating
+    FROM player_stats ps
+    JOIN matches m
+        ON ps.match_id = m.match_id
+    GROUP BY ps.player_id, ps.club_id, m.season;
+
+    -- Required for REFRESH ... CONCURRENTLY.
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_player_season_stats_key
+    ON player_season_stats(player_id, club_id, season);
+
+    CREATE INDEX IF NOT EXISTS idx_player_season_stats_club_season
+    ON player_season_stats(club_id, season);
+
+    -- One row per player and match with opponent and result resolved,
+    -- used by /player-stats/{player_id}.
+    CREATE MATERIALIZED VIEW IF NOT EXISTS player_match_log AS
+    SELECT
+        ps.player_id,
+        ps.match_id,
+        m.game_date,
+        m.season,
+        m.league,
+
+        c.club_name AS club_name,
+        opp.club_name AS opponent_name,
+
+        CASE
+            WHEN ps.club_id = m.home_club_id THEN 'home'
+            ELSE 'away'
+        END AS home_away,
+
+        CASE
+            WHEN ps.club_id = m.home_club_id THEN m.home_goals
+            ELSE m.away_goals
+        END AS goals_for,
+
+        CASE
+            WHEN ps.club_id = m.home_club_id THEN m.away_goals
+            ELSE m.home_goals
+        END AS goals_against,
+
+        CASE
+            WHEN (
+                (ps.club_id = m.home_club_id AND m.home_goals > m.away_goals) OR
+                (ps.club_id = m.away_club_id AND m.away_goals > m.home_goals)
+            ) THEN 'Win'
+            WHEN m.home_goals = m.away_goals THEN 'Draw'
+            ELSE 'Loss'
+        END AS result,
+
+        ps.goals,
+        ps.assists,
+        ps.yellow,
+        ps.yellow_red,
+        ps.red,
+        ps.start_eleven,
+        ps.minutes,
+        ps.on_min,
+        ps.off_min,
+        ps.rating
+
+    FROM player_stats ps
+    JOIN matches m
+        ON ps.match_id = m.match_id
+
+    JOIN clubs c
+        ON ps.club_id = c.club_id
+
+    JOIN clubs opp
+        ON opp.club_id = CASE
+            WHEN ps.club_id = m.home_club_id THEN m.away_club_id
+            ELSE m.home_club_id
+        END;
+
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_player_match_log_key
+    ON player_match_log(player_id, match_id);
+
+    CREATE INDEX IF NOT EXISTS idx_player_match_log_player_date
+    ON player_match_log(player_id, game_date DESC);
+
+    -- Stamp bumped on every refresh; the API uses it to invalidate its
+    -- response cache and to build ETag / Last-Modified headers.
+    CREATE TABLE IF NOT EXISTS data_version (
+        id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+        version BIGINT NOT NULL DEFAULT 1,
+        updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+    );
+
+    INSERT INTO data_version DEFAULT VALUES
+    ON CONFLICT (id) DO NOTHING;
+
+    -- Single entry point for rebuilding all derived tables after a load.
+    CREATE OR REPLACE FUNCTION refresh_aggregates() RETURNS void
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        REFRESH MATERIALIZED VIEW CONCURRENTLY player_season_stats;
+        REFRESH MATERIALIZED VIEW CONCURRENTLY player_match_log;
+
+        UPDATE data_version
+        SET version = version + 1,
+            updated_at = now();
+    END;
+    $$;
@@ -0,0 +1,2 @@
+-- Rebuild derived tables. Run again after every manual load (02-07).
+SELECT refresh_aggregates();
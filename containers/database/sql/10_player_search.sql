@@ -0,0 +1,6 @@
+    -- Substring / prefix name search for /players/search. Idempotent: the API
+    -- applies this file at startup, which adds it to existing databases.
+    CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+    CREATE INDEX IF NOT EXISTS idx_players_name_trgm
+    ON players USING gin (player_name gin_trgm_ops);
@@ -0,0 +1,15 @@
+    -- Indexes of the API queries. Idempotent: the API applies this file at
+    -- startup, which adds them to existing databases.
+
+    -- Keyset pagination for /teams and /players.
+    CREATE INDEX IF NOT EXISTS idx_clubs_name_id
+    ON clubs(club_name, club_id);
+
+    CREATE INDEX IF NOT EXISTS idx_players_name_id
+    ON players(player_name, player_id);
+
+    -- Player stats per club; replaces the club_id-only index.
+    CREATE INDEX IF NOT EXISTS idx_player_stats_club_match
+    ON player_stats(club_id, match_id);
+
+    DROP INDEX IF EXISTS idx_player_stats_club;
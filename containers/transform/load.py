@@ -0,0 +1,345 @@
+"""
+Delta Upsert Loader
+
+Loads transformed CSV files into Postgres without requiring an empty database.
+Each file is streamed with COPY into a temporary staging table and merged into
+its target table with INSERT ... ON CONFLICT DO UPDATE. Tables are processed in
+foreign key order and every batch (one directory of files) is loaded in a
+single transaction, so a failed batch leaves the database unchanged. Once the
+batches are committed, refresh_aggregates() rebuilds the derived tables read
+by the API and bumps data_version, which invalidates the API caches.
+
+Usage:
+    python load.py [DIR ...]
+
+Without arguments the transform output directory is loaded. The connection is
+configured through DB_HOST, DB_PORT, DB_NAME, DB_USER and DB_PASSWORD.
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, IO, List, Sequence, Tuple
+
+import pandas as pd
+import psycopg2
+from psycopg2 import sql
+
+from toolkit import get_transform_dir
+
+
+def _overwrite(*columns: str) -> Dict[str, str]:
+    return {c: f"EXCLUDED.{c}" for c in columns}
+
+
+# (table, csv file, columns in CSV order, conflict key, updates), in foreign
+# key order. ``updates`` maps the columns a re-load may change to the SQL
+# expression of their new value; other columns keep their stored value.
+# The column lists mirror containers/database/sql/0*_load_*.sql.
+TABLES: List[Tuple[str, str, Tuple[str, ...], Tuple[str, ...], Dict[str, str]]] = [
+    (
+        "clubs",
+        "clubs.csv",
+        ("club_id", "club_name", "plz", "location"),
+        ("club_id",),
+        _overwrite("club_name", "plz", "location"),
+    ),
+    (
+        "clubs_per_season",
+        "clubs_per_season.csv",
+        ("club_id", "league", "season"),
+        ("club_id", "season"),
+        _overwrite("league"),
+    ),
+    (
+        "players",
+        "players.csv",
+        ("player_id", "player_name", "nationality", "date_of_birth", "height", "position"),
+        ("player_id",),
+        _overwrite("player_name", "nationality", "date_of_birth", "height", "position"),
+    ),
+    (
+        "squads",
+        "squads.csv",
+        ("player_id", "club_id", "season"),
+        ("player_id", "club_id", "season"),
+        {},
+    ),
+    (
+        "matches",
+        "matches.csv",
+        ("match_id", "season", "league", "game_date", "home_club_id", "away_club_id", "home_goals", "away_goals"),
+        ("match_id",),
+        _overwrite("season", "league", "game_date", "home_club_id", "away_club_id", "home_goals", "away_goals"),
+    ),
+    (
+        "player_stats",
+        "player_stats.csv",
+        (
+            "player_id", "match_id", "club_id", "goals", "assists", "yellow", "yellow_red", "red",
+            "start_eleven", "minutes", "on_min", "off_min", "team_goals", "team_conceded", "rating",
+        ),
+        ("player_id", "match_id"),
+        {
+            **_overwrite(
+                "club_id", "goals", "assists", "yellow", "yellow_red", "red",
+                "start_eleven", "minutes", "on_min", "off_min", "team_goals", "team_conceded",
+            ),
+            # The transform writes a 0.0 placeholder; real ratings come from
+            # rating_model/apply_model.ipynb and must not be reset by a re-load.
+            "rating": "COALESCE(NULLIF(EXCLUDED.rating, 0), player_stats.rating)",
+        },
+    ),
+]
+
+# Transform output headers that differ from the table's column names.
+FRAME_COLUMNS: Dict[str, Dict[str, str]] = {
+    "clubs": {"PLZ": "plz"},
+    "matches": {"date": "game_date"},
+}
+
+# Transform pipeline dataset -> target table.
+DATASET_TABLES = {
+    "teams": "clubs",
+    "team_per_season": "clubs_per_season",
+    "player": "players",
+    "squad": "squads",
+    "matches": "matches",
+    "player_stats": "player_stats",
+}
+
+
+def get_connection():
+    """Open a Postgres connection from the DB_* environment variables."""
+    return psycopg2.connect(
+        host=os.getenv("DB_HOST"),
+        port=os.getenv("DB_PORT"),
+        dbname=os.getenv("DB_NAME"),
+        user=os.getenv("DB_USER"),
+        password=os.getenv("DB_PASSWORD"),
+    )
+
+
+def upsert_stream(
+    cur,
+    table: str,
+    columns: Sequence[str],
+    key: Sequence[str],
+    updates: Dict[str, str],
+    stream: IO,
+    header: bool = True,
+) -> int:
+    """
+    COPY a CSV stream into a staging table and upsert it into ``table``.
+
+    Args:
+        cur: Open cursor; the caller owns the transaction
+        table (str): Target table
+        columns (Sequence[str]): Target columns in CSV column order
+        key (Sequence[str]): Conflict key of the target table
+        updates (Dict[str, str]): Column -> SQL expression applied on conflict
+        stream (IO): Readable CSV stream
+        header (bool): Whether the stream starts with a header line
+
+    Returns:
+        int: Number of rows inserted or updated
+    """
+    stage = f"stage_{table}"
+    cols = sql.SQL(", ").join(map(sql.Identifier, columns))
+    key_cols = sql.SQL(", ").join(map(sql.Identifier, key))
+
+    cur.execute(
+        sql.SQL("CREATE TEMP TABLE {} (LIKE {} INCLUDING DEFAULTS) ON COMMIT DROP").format(
+            sql.Identifier(stage), sql.Identifier(table)
+        )
+    )
+    # Numbers the rows in stream order; the last row of a repeated key wins.
+    cur.execute(sql.SQL("ALTER TABLE {} ADD COLUMN stage_seq BIGSERIAL").format(sql.Identifier(stage)))
+    cur.copy_expert(
+        sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT csv, HEADER {})").format(
+            sql.Identifier(stage), cols, sql.SQL("true" if header else "false")
+        ).as_string(cur),
+        stream,
+    )
+
+    if updates:
+        on_conflict = sql.SQL("DO UPDATE SET {}").format(
+            sql.SQL(", ").join(
+                sql.SQL("{} = {}").format(sql.Identifier(c), sql.SQL(expr)) for c, expr in updates.items()
+            )
+        )
+    else:
+        on_conflict = sql.SQL("DO NOTHING")
+
+    # DISTINCT ON: a batch may repeat a key, which ON CONFLICT cannot update twice.
+    cur.execute(
+        sql.SQL(
+            "INSERT INTO {table} ({cols}) "
+            "SELECT DISTINCT ON ({key}) {cols} FROM {stage} "
+            "ORDER BY {key}, stage_seq DESC "
+            "ON CONFLICT ({key}) {on_conflict}"
+        ).format(
+            table=sql.Identifier(table),
+            cols=cols,
+            key=key_cols,
+            stage=sql.Identifier(stage),
+            on_conflict=on_conflict,
+        )
+    )
+    rowcount = cur.rowcount
+
+    cur.execute(sql.SQL("DROP TABLE {}").format(sql.Identifier(stage)))
+    return rowcount
+
+
+class FrameStream:
+    """
+    Read-only file object that renders a DataFrame as CSV ``chunk_rows`` rows
+    at a time, so COPY can consume it without a full in-memory copy.
+    """
+
+    def __init__(self, df: pd.DataFrame, chunk_rows: int = 50000):
+        self._chunks = (
+            df.iloc[i:i + chunk_rows].to_csv(index=False, header=False)
+            for i in range(0, len(df), chunk_rows)
+        )
+        self._chunk = ""
+        self._pos = 0
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> str:
+        # Hand out slices of the current chunk at a read offset instead of
+        # re-slicing a buffer, which would copy the chunk on every read.
+        parts = []
+        remaining = size
+        while size < 0 or remaining > 0:
+            if self._pos >= len(self._chunk):
+                self._chunk = next(self._chunks, None)
+                self._pos = 0
+                if self._chunk is None:
+                    self._chunk = ""
+                    break
+
+            end = len(self._chunk) if size < 0 else min(len(self._chunk), self._pos + remaining)
+            parts.append(self._chunk[self._pos:end])
+            remaining -= end - self._pos
+            self._pos = end
+
+        out = "".join(parts)
+        self.bytes_read += len(out)
+        return out
+
+
+def _table_spec(table: str) -> Tuple[Tuple[str, ...], Tuple[str, ...], Dict[str, str]]:
+    for name, _filename, columns, key, updates in TABLES:
+        if name == table:
+            return columns, key, updates
+    raise KeyError(f"Unknown table: {table}")
+
+
+def upsert_frame(cur, table: str, df: pd.DataFrame) -> Dict[str, float]:
+    """
+    Stream a transformed DataFrame into ``table`` with COPY FROM STDIN and
+    upsert it. The DataFrame must carry exactly the table's columns (under
+    their transform names, see FRAME_COLUMNS); they are matched by name, not
+    position.
+
+    Returns:
+        Dict[str, float]: rows, bytes, seconds and throughput of the load
+    """
+    columns, key, updates = _table_spec(table)
+    aliases = FRAME_COLUMNS.get(table, {})
+    names = [aliases.get(c, c) for c in df.columns]
+    if sorted(names) != sorted(columns):
+        raise ValueError(f"{table}: expected columns {list(columns)}, got {df.columns.tolist()}")
+    df = df.set_axis(names, axis=1)[list(columns)]
+
+    stream = FrameStream(df)
+    started = time.perf_counter()
+    upserted = upsert_stream(cur, table, columns, key, updates, stream, header=False)
+    seconds = time.perf_counter() - started
+
+    return {
+        "rows": len(df),
+        "upserted": upserted,
+        "bytes": stream.bytes_read,
+        "seconds": seconds,
+        "rows_per_s": len(df) / seconds if seconds else 0.0,
+        "mb_per_s": stream.bytes_read / 1e6 / seconds if seconds else 0.0,
+    }
+
+
+def refresh_aggregates(cur) -> None:
+    """Rebuild the derived tables and bump data_version; the caller commits."""
+    cur.execute("SELECT refresh_aggregates()")
+    print("[OK] Derived tables refreshed")
+
+
+def load_batch(conn, batch_dir: Path) -> Dict[str, int]:
+    """
+    Upsert every known CSV file of ``batch_dir`` in one transaction.
+
+    Args:
+        conn: Open connection
+        batch_dir (Path): Directory with transformed CSV files
+
+    Returns:
+        Dict[str, int]: Upserted rows per table
+    """
+    counts = {}
+
+    with conn:
+        with conn.cursor() as cur:
+            for table, filename, columns, key, updates in TABLES:
+                path = batch_dir / filename
+                if not path.exists():
+                    continue
+
+                with path.open("r", encoding="utf-8-sig") as f:
+                    counts[table] = upsert_stream(cur, table, columns, key, updates, f)
+                print(f"[OK] {table}: {counts[table]} rows upserted from {path}")
+
+    return counts
+
+
+def load_batches(batch_dirs: Sequence[Path]) -> bool:
+    """
+    Load each batch directory in its own transaction and refresh the derived
+    tables once afterwards. Upserts are idempotent, so a batch can safely be
+    loaded again after a failure.
+
+    Returns:
+        bool: True if every batch was loaded
+    """
+    conn = get_connection()
+    ok = True
+    loaded = False
+
+    try:
+        for batch_dir in batch_dirs:
+            print(f"\nLoading batch: {batch_dir}")
+            try:
+                loaded |= bool(load_batch(conn, batch_dir))
+            except Exception as e:
+                print(f"[ERROR] Batch {batch_dir} rolled back: {e}")
+                ok = False
+
+        # Once for all batches; the refresh rebuilds the derived tables in full.
+        if loaded:
+            try:
+                with conn:
+                    with conn.cursor() as cur:
+                        refresh_aggregates(cur)
+            except Exception as e:
+                print(f"[ERROR] Refreshing derived tables failed: {e}")
+                ok = False
+    finally:
+        conn.close()
+
+    return ok
+
+
+if __name__ == "__main__":
+    dirs = [Path(p) for p in sys.argv[1:]] or [get_transform_dir()]
+    sys.exit(0 if load_batches(dirs) else 1)
@@ -2,16 +2,42 @@
 Containerized Data Transformation Pipeline
 
 This script serves as the main entry point for the data transformation pipeline running in Docker.
-It checks for available CSV files and runs the corresponding transformation scripts.
+It checks for available CSV files and runs the corresponding transformation scripts as a
+dependency graph: independent transformations run in parallel worker processes.
 """
 
+import multiprocessing
 import os
 import sys
-from pathlib import Path
-import importlib.util
-from typing import Callable, Dict, Optional
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Optional, Tuple
 
-from toolkit import get_expected_input_files, get_scrape_dir, get_transform_dir
+import pandas as pd
+
+import matches
+import player
+import player_stats
+import squad
+import team_per_season
+import teams
+from load import DATASET_TABLES, get_connection, refresh_aggregates, upsert_frame
+from toolkit import get_expected_input_files, get_scrape_dir, get_sinks, get_transform_dir
+
+
+# Transformation stages in foreign key order. Each module declares
+# DEPENDS_ON, a tuple of the stages whose tables its own table references.
+# This is load order, not a data input (every transform reads only its own
+# scrape file): run_pipeline only enforces it when loading into the database,
+# where it loads those stages first and skips the stage if one of them fails.
+STAGES = {
+    "teams": teams,
+    "player": player,
+    "team_per_season": team_per_season,
+    "squad": squad,
+    "matches": matches,
+    "player_stats": player_stats,
+}
 
 
 def check_available_data_files() -> Dict[str, str]:
@@ -44,73 +70,188 @@ def check_available_data_files() -> Dict[str, str]:
     return available_files
 
 
-def import_transformation_module(module_name: str) -> Optional[Callable[[], None]]:
+def run_stage(dataset_name: str, keep_frame: bool) -> Tuple[Optional[pd.DataFrame], float]:
     """
-    Dynamically import a transformation module and return its main function.
+    Run one transformation; executed in a worker process.
     
     Args:
-        module_name (str): Name of the module to import (without .py extension)
+        dataset_name (str): Name of the dataset to transform
+        keep_frame (bool): Return the transformed data to the caller (db sink)
         
     Returns:
-        Optional[Callable[[], None]]: The transformation function or None on failure
+        Tuple[Optional[pd.DataFrame], float]: The transformed data (or None) and the
+        transformation time in seconds
     """
-    try:
-        module_path = Path(f"/app/{module_name}.py")
-        if not module_path.exists():
-            raise FileNotFoundError(f"Transformation script {module_path} not found")
-        
-        spec = importlib.util.spec_from_file_location(module_name, module_path)
-        if spec is None or spec.loader is None:
-            raise ImportError(f"Failed to create import spec for {module_name}")
+    transform_function = getattr(STAGES[dataset_name], f"transform_{dataset_name}_data")
+    
+    started = time.perf_counter()
+    df = transform_function()
+    seconds = time.perf_counter() - started
+    
+    return (df if keep_frame else None), seconds
 
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+
+def load_into_database(cur, dataset_name: str, df: pd.DataFrame) -> Optional[Dict[str, float]]:
+    """
+    Stream a transformed dataset straight into its Postgres table.
+    
+    The load runs inside a savepoint, so a failed dataset is rolled back on its
+    own and the datasets loaded before it are still committed.
+    
+    Args:
+        cur: Cursor of the pipeline's load transaction
+        dataset_name (str): Name of the transformed dataset
+        df (pd.DataFrame): The transformed data
         
-        # Get the main transformation function
-        function_name = f"transform_{module_name}_data"
-        if hasattr(module, function_name):
-            return getattr(module, function_name)
-        else:
-            raise AttributeError(f"Function {function_name} not found in {module_name}")
-            
+    Returns:
+        Optional[Dict[str, float]]: Load throughput, or None if the load failed
+    """
+    table = DATASET_TABLES[dataset_name]
+    cur.execute(f"SAVEPOINT load_{dataset_name}")
+    try:
+        stats = upsert_frame(cur, table, df)
     except Exception as e:
-        print(f"Error importing {module_name}: {e}")
+        cur.execute(f"ROLLBACK TO SAVEPOINT load_{dataset_name}")
+        print(f"[ERROR] Error loading {dataset_name} into {table}: {e}")
         return None
+    cur.execute(f"RELEASE SAVEPOINT load_{dataset_name}")
 
+    print(
+        f"[SUCCESS] Loaded {stats['rows']} rows into {table} in {stats['seconds']:.2f}s "
+        f"({stats['rows_per_s']:.0f} rows/s, {stats['mb_per_s']:.1f} MB/s)"
+    )
+    return stats
 
-def run_transformation(dataset_name: str, file_path: str) -> bool:
+
+def refresh_derived_tables(cur) -> bool:
+    """
+    Rebuild the derived tables and bump data_version inside the load
+    transaction, in a savepoint so a failed refresh keeps the loaded data.
+    
+    Returns:
+        bool: True if the refresh succeeded
     """
-    Run the transformation for a specific dataset.
+    cur.execute("SAVEPOINT refresh_aggregates")
+    try:
+        refresh_aggregates(cur)
+    except Exception as e:
+        cur.execute("ROLLBACK TO SAVEPOINT refresh_aggregates")
+        print(f"[ERROR] Error refreshing derived tables: {e}")
+        return False
+    cur.execute("RELEASE SAVEPOINT refresh_aggregates")
+    return True
+
+
+def get_worker_count() -> int:
+    """Number of transformation processes, from TRANSFORM_WORKERS."""
+    default = min(os.cpu_count() or 1, len(STAGES))
+    return max(1, int(os.getenv("TRANSFORM_WORKERS", default)))
+
+
+def run_pipeline(available_files: Dict[str, str], cur=None) -> Dict[str, Dict]:
+    """
+    Run the transformations as a dependency graph in a process pool.
+    
+    Without a cursor (csv sink) every dataset starts right away. With a
+    cursor a dataset is started as soon as every dataset in its ``DEPENDS_ON``
+    has been transformed and loaded, so independent datasets (e.g. teams and
+    player) still run in parallel; a failed dataset then skips only the
+    datasets that depend on it, directly or transitively. A dataset without a
+    source file does not block its dependents; their references may already
+    be loaded.
     
     Args:
-        dataset_name (str): Name of the dataset to transform
-        file_path (str): Path to the source CSV file
+        available_files (Dict[str, str]): Mapping of dataset names to their source files
+        cur: Cursor of the load transaction, or None to skip the database load
         
     Returns:
-        bool: True if transformation succeeded, False otherwise
+        Dict[str, Dict]: Per dataset: status (ok, failed, skipped, missing) and
+        transform / load timings
     """
-    print(f"\n{'='*60}")
-    print(f"Starting transformation for: {dataset_name}")
-    print(f"Source file: {file_path}")
-    print(f"{'='*60}")
+    results = {
+        name: {"status": "pending" if name in available_files else "missing"}
+        for name in STAGES
+    }
+    # Registry order is a topological order, so one pass per round resolves
+    # skips transitively.
+    waiting = [name for name in STAGES if name in available_files]
     
-    try:
-        # Import and run the transformation function
-        transform_function = import_transformation_module(dataset_name)
-        
-        if transform_function is None:
-            print(f"[ERROR] Failed to load transformation for {dataset_name}")
-            return False
-        
-        # Execute the transformation
-        transform_function()
-        
-        print(f"[SUCCESS] Successfully completed transformation for {dataset_name}")
-        return True
+    # Workers only transform; the database is used by this process alone.
+    # spawn keeps them from inheriting its open connection, which a fork
+    # (done lazily on submit) would copy into every worker.
+    with ProcessPoolExecutor(
+        max_workers=get_worker_count(),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as pool:
+        running = {}
         
-    except Exception as e:
-        print(f"[ERROR] Error transforming {dataset_name}: {e}")
-        return False
+        while True:
+            for name in list(waiting):
+                deps = STAGES[name].DEPENDS_ON if cur is not None else ()
+                statuses = [results[dep]["status"] for dep in deps]
+                if any(s in ("failed", "skipped") for s in statuses):
+                    waiting.remove(name)
+                    results[name]["status"] = "skipped"
+                    print(f"[SKIPPED] {name}: a dependency failed")
+                elif all(s in ("ok", "missing") for s in statuses):
+                    waiting.remove(name)
+                    print(f"[STARTED] {name} ({available_files[name]})")
+                    running[pool.submit(run_stage, name, cur is not None)] = name
+            
+            if not running:
+                break
+            
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                result = results[name]
+                try:
+                    df, result["transform_s"] = future.result()
+                except Exception as e:
+                    result["status"] = "failed"
+                    print(f"[ERROR] Error transforming {name}: {e}")
+                    continue
+                
+                print(f"[SUCCESS] Transformed {name} in {result['transform_s']:.2f}s")
+                if cur is not None:
+                    stats = load_into_database(cur, name, df)
+                    if stats is None:
+                        result["status"] = "failed"
+                        continue
+                    result["load"] = stats
+                result["status"] = "ok"
+    
+    # Left over only with an unknown or cyclic dependency.
+    for name in waiting:
+        results[name]["status"] = "skipped"
+        print(f"[SKIPPED] {name}: unresolved dependencies {STAGES[name].DEPENDS_ON}")
+    
+    return results
+
+
+def print_stage_summary(results: Dict[str, Dict]) -> None:
+    """Print the status and timing of every stage."""
+    print(f"\n{'='*60}")
+    print("STAGE TIMINGS")
+    print(f"{'='*60}")
+    print(f"{'dataset':<18}{'status':<10}{'transform s':>13}{'load s':>10}")
+    for name, result in results.items():
+        transform_s = f"{result['transform_s']:.2f}" if "transform_s" in result else "-"
+        load_s = f"{result['load']['seconds']:.2f}" if "load" in result else "-"
+        print(f"{name:<18}{result['status']:<10}{transform_s:>13}{load_s:>10}")
+
+
+def print_load_summary(load_stats: Dict[str, Dict[str, float]]) -> None:
+    """Print the per-table load throughput."""
+    print(f"\n{'='*60}")
+    print("DATABASE LOAD THROUGHPUT")
+    print(f"{'='*60}")
+    print(f"{'table':<18}{'rows':>10}{'MB':>9}{'s':>8}{'rows/s':>11}{'MB/s':>8}")
+    for dataset, stats in load_stats.items():
+        print(
+            f"{DATASET_TABLES[dataset]:<18}{stats['rows']:>10}{stats['bytes'] / 1e6:>9.2f}"
+            f"{stats['seconds']:>8.2f}{stats['rows_per_s']:>11.0f}{stats['mb_per_s']:>8.1f}"
+        )
 
 
 def create_output_directory():
@@ -140,31 +281,34 @@ def main():
     
     print(f"\nFound {len(available_files)} datasets to transform")
     
-    # Define processing order (some datasets may depend on others)
-    processing_order = [
-        'teams',           # Base team data
-        'player',          # Base player data  
-        'team_per_season', # Team-season relationships
-        'squad',           # Player-team-season relationships
-        'matches',         # Match data
-        'player_stats'     # Player statistics (may reference other tables)
-    ]
-    
-    # Track transformation results
-    successful_transforms = []
-    failed_transforms = []
-    
-    # Process datasets in the defined order
-    for dataset_name in processing_order:
-        if dataset_name in available_files:
-            file_path = available_files[dataset_name]
-            
-            success = run_transformation(dataset_name, file_path)
-            
-            if success:
-                successful_transforms.append(dataset_name)
-            else:
-                failed_transforms.append(dataset_name)
+    # With the db sink every dataset is streamed into Postgres right after its
+    # transformation; each load has its own savepoint and the successful ones
+    # are committed together with a refresh of the derived tables.
+    conn = get_connection() if "db" in get_sinks() else None
+    cur = conn.cursor() if conn is not None else None
+    
+    started = time.perf_counter()
+    refresh_failed = False
+    try:
+        results = run_pipeline(available_files, cur)
+        if conn is not None:
+            if any("load" in r for r in results.values()):
+                refresh_failed = not refresh_derived_tables(cur)
+            conn.commit()
+    finally:
+        if conn is not None:
+            conn.close()
+    elapsed = time.perf_counter() - started
+    
+    successful_transforms = [name for name, r in results.items() if r["status"] == "ok"]
+    failed_transforms = [name for name, r in results.items() if r["status"] in ("failed", "skipped")]
+    
+    print_stage_summary(results)
+    print(f"\nWall time: {elapsed:.2f}s")
+    
+    load_stats = {name: r["load"] for name, r in results.items() if "load" in r}
+    if load_stats:
+        print_load_summary(load_stats)
     
     # Print final summary
     print(f"\n{'='*60}")
@@ -183,6 +327,10 @@ def main():
     success_rate = len(successful_transforms) / len(available_files) * 100
     print(f"\nSuccess Rate: {success_rate:.1f}% ({len(successful_transforms)}/{len(available_files)})")
     
+    if refresh_failed:
+        print(f"\n[WARNING] Data was loaded but the derived tables are stale; run refresh_aggregates().")
+        return False
+    
     if failed_transforms:
         print(f"\n[WARNING] Some transformations failed. Check the logs above for details.")
         return False
@@ -21,6 +21,9 @@ from toolkit import (
 )
 
 
+DEPENDS_ON = ("team_per_season",)
+
+
 def convert_date_column(df: pd.DataFrame) -> pd.DataFrame:
     """
     Convert date column from string to datetime format.
@@ -42,7 +45,7 @@ def convert_date_column(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def transform_matches_data() -> None:
+def transform_matches_data() -> pd.DataFrame:
     """
     Main function to orchestrate the matches data transformation process.
     """
@@ -73,6 +76,8 @@ def transform_matches_data() -> None:
         print(f"Final data types:")
         print(df.dtypes.to_string())
         print("\nMatches data transformation completed successfully!")
+
+        return df
         
     except Exception as e:
         print(f"Error during transformation: {e}")
@@ -21,6 +21,9 @@ from toolkit import (
 )
 
 
+DEPENDS_ON = ()
+
+
 def convert_date_of_birth(df: pd.DataFrame) -> pd.DataFrame:
     """
     Convert date_of_birth column from string to datetime format.
@@ -73,7 +76,7 @@ def convert_height_to_float(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def transform_player_data() -> None:
+def transform_player_data() -> pd.DataFrame:
     """
     Main function to orchestrate the player data transformation process.
     """
@@ -98,6 +101,8 @@ def transform_player_data() -> None:
         
         print(f"\nFinal columns: {df.columns.tolist()}")
         print("Player data transformation completed successfully!")
+
+        return df
         
     except Exception as e:
         print(f"Error during transformation: {e}")
@@ -16,6 +16,9 @@ import pandas as pd
 from toolkit import get_input_path, get_output_path, load_csv_data, save_transformed_data
 
 
+DEPENDS_ON = ("matches", "player")
+
+
 def convert_card_columns_to_bool(df: pd.DataFrame) -> pd.DataFrame:
     """
     Convert card columns from int64 (0/1) to bool (False/True).
@@ -101,7 +104,7 @@ def add_rating_column(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def transform_player_stats_data() -> None:
+def transform_player_stats_data() -> pd.DataFrame:
     """
     Main function to orchestrate the player statistics data transformation process.
     """
@@ -137,6 +140,8 @@ def transform_player_stats_data() -> None:
         print(f"Rating column added: {'rating' in df.columns}")
         
         print("\nPlayer statistics data transformation completed successfully!")
+
+        return df
         
     except Exception as e:
         print(f"Error during transformation: {e}")
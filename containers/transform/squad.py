@@ -21,7 +21,10 @@ from toolkit import (
 )
 
 
-def transform_squad_data() -> None:
+DEPENDS_ON = ("player", "team_per_season")
+
+
+def transform_squad_data() -> pd.DataFrame:
     """
     Main function to orchestrate the squad data transformation process.
     """
@@ -47,6 +50,8 @@ def transform_squad_data() -> None:
         print(f"Final data types:")
         print(df.dtypes.to_string())
         print("\nSquad data transformation completed successfully!")
+
+        return df
         
     except Exception as e:
         print(f"Error during transformation: {e}")
@@ -21,7 +21,10 @@ from toolkit import (
 )
 
 
-def transform_team_per_season_data() -> None:
+DEPENDS_ON = ("teams",)
+
+
+def transform_team_per_season_data() -> pd.DataFrame:
     """
     Main function to orchestrate the team per season data transformation process.
     """
@@ -47,6 +50,8 @@ def transform_team_per_season_data() -> None:
         print(f"Final data types:")
         print(df.dtypes.to_string())
         print("\nTeam per season data transformation completed successfully!")
+
+        return df
         
     except Exception as e:
         print(f"Error during transformation: {e}")
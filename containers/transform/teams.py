@@ -22,6 +22,9 @@ from toolkit import (
 )
 
 
+DEPENDS_ON = ()
+
+
 def fix_old_names(df: pd.DataFrame) -> pd.DataFrame:
     """
     Entfernt Zeilen mit alten Teamnamen, die nicht mehr benötigt werden.
@@ -87,7 +90,7 @@ def clean_plz_column(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def transform_teams_data() -> None:
+def transform_teams_data() -> pd.DataFrame:
     """
     Main function to orchestrate the teams data transformation process.
     """
@@ -113,6 +116,8 @@ def transform_teams_data() -> None:
         
         print(f"\nFinal columns: {df.columns.tolist()}")
         print("Teams data transformation completed successfully!")
+
+        return df
         
     except Exception as e:
         print(f"Error during transformation: {e}")
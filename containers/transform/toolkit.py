@@ -11,8 +11,10 @@ import os
 import pandas as pd
 
 
-SCRAPE_ROOT = Path("/data/scrape/amateur")
-TRANSFORM_ROOT = Path("/data/transform")
+# Overridable so a weekly delta (data/scrape/<league_type>/delta/<run>) can be
+# transformed and loaded on its own.
+SCRAPE_ROOT = Path(os.getenv("SCRAPE_DIR", "/data/scrape/amateur"))
+TRANSFORM_ROOT = Path(os.getenv("TRANSFORM_DIR", "/data/transform"))
 
 DATASET_INPUT_FILENAMES = {
     "teams": "clubs.csv",
@@ -130,8 +132,21 @@ def remove_unnecessary_columns(
     return df
 
 
+def get_sinks() -> set[str]:
+    """
+    Return where transformed data goes: ``csv`` (files in the transform
+    directory), ``db`` (COPY straight into Postgres) or both, from the
+    comma-separated TRANSFORM_SINK variable.
+    """
+    return {s.strip() for s in os.getenv("TRANSFORM_SINK", "csv").split(",") if s.strip()}
+
+
 def save_transformed_data(df: pd.DataFrame, output_path: str) -> None:
     """Save transformed data to CSV and ensure output directory exists."""
+    if "csv" not in get_sinks():
+        print(f"CSV sink disabled, not writing: {output_path}")
+        return
+
     output_dir = Path(output_path).parent
     output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -1,16 +1,191 @@
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 API_URL = os.getenv("API_URL", "http://160.85.253.241:8000")
+CACHE_TTL = int(os.getenv("FRONTEND_CACHE_TTL", "300"))
 
 
-def _get_df(path, params=None):
-    response = requests.get(f"{API_URL}{path}", params=params, timeout=30)
+class CacheStats:
+    """Request counters shared by all user sessions of this Streamlit server."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.misses = 0
+
+    def record_call(self):
+        with self._lock:
+            self.calls += 1
+
+    def record_miss(self):
+        with self._lock:
+            self.misses += 1
+
+    @property
+    def hits(self):
+        return self.calls - self.misses
+
+    def snapshot(self):
+        with self._lock:
+            calls, misses = self.calls, self.misses
+        return {
+            "calls": calls,
+            "hits": calls - misses,
+            "misses": misses,
+            "hit_rate": round((calls - misses) / calls, 3) if calls else 0.0,
+            "ttl_s": CACHE_TTL,
+        }
+
+
+@st.cache_resource
+def _session():
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@st.cache_resource
+def _executor():
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="api-fetch")
+
+
+@st.cache_resource
+def cache_stats():
+    return CacheStats()
+
+
+def _request_df(path, params=None, ids=None):
+    if ids is None:
+        response = _session().get(f"{API_URL}{path}", params=params and dict(params), timeout=30)
+    else:
+        response = _session().post(f"{API_URL}{path}", json={"ids": list(ids)}, timeout=30)
+
     response.raise_for_status()
     return pd.DataFrame(response.json())
 
 
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _fetch_df(path, params=None, ids=None):
+    # Only runs on a cache miss; params and ids are tuples so the cache key
+    # does not depend on argument order.
+    cache_stats().record_miss()
+    return _request_df(path, params, ids)
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _fetch_json(path, params=None):
+    cache_stats().record_miss()
+    response = _session().get(f"{API_URL}{path}", params=params and dict(params), timeout=30)
+    response.raise_for_status()
+    return response.json()
+
+
+def _get_df(path, params=None):
+    cache_stats().record_call()
+    return _fetch_df(path, tuple(sorted(params.items())) if params else None)
+
+
+def _post_df(path, ids):
+    cache_stats().record_call()
+    return _fetch_df(path, ids=tuple(sorted({int(i) for i in ids})))
+
+
+def get_json(path):
+    response = _session().get(f"{API_URL}{path}", timeout=30)
+    response.raise_for_status()
+    return response.json()
+
+
+def fetch_many(calls):
+    """
+    Run several API functions concurrently.
+
+    ``calls`` maps a name to ``(function, *args)``; the result maps the same
+    names to the returned DataFrames. Page latency becomes the slowest call
+    instead of the sum of all calls.
+    """
+    ctx = get_script_run_ctx()
+
+    def _run(fn, args):
+        add_script_run_ctx(ctx=ctx)
+        return fn(*args)
+
+    futures = {
+        name: _executor().submit(_run, call[0], call[1:])
+        for name, call in calls.items()
+    }
+    return {name: future.result() for name, future in futures.items()}
+
+
+def clear_cache():
+    _fetch_df.clear()
+    _fetch_json.clear()
+    get_data_version.clear()
+    _team_options.clear()
+    _player_options.clear()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def get_data_version():
+    return get_json("/data-version")["version"]
+
+
+def _name_index(df, name_col, id_col, detail_col=None):
+    """
+    Build a label -> id mapping for a selectbox without iterating rows.
+
+    Names that occur more than once get the detail column appended
+    (e.g. the date of birth) and, if that is still ambiguous, the id.
+    """
+    if df.empty:
+        return {}
+
+    labels = df[name_col].fillna("").astype(str)
+
+    if detail_col is not None and detail_col in df.columns:
+        detail = df[detail_col].astype("string")
+        mask = labels.duplicated(keep=False) & detail.notna()
+        labels = labels.mask(mask, labels + " (" + detail + ")")
+
+    mask = labels.duplicated(keep=False)
+    labels = labels.mask(mask, labels + " #" + df[id_col].astype(str))
+
+    return dict(zip(labels.tolist(), df[id_col].astype(int).tolist()))
+
+
+# The indexes are pinned until the version changes, so they are built from a
+# fresh request rather than from _fetch_df, whose TTL cache may still hold the
+# rows of the previous version.
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _team_options(version):
+    return _name_index(_request_df("/teams"), "club_name", "club_id")
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _player_options(version):
+    players = _request_df("/players", (("fields", "player_id,player_name,date_of_birth"),))
+    return _name_index(players, "player_name", "player_id", detail_col="date_of_birth")
+
+
+def get_team_options():
+    """Team name -> club_id, rebuilt only when the backend data version changes."""
+    return _team_options(get_data_version())
+
+
+def get_player_options():
+    """Player label -> player_id, rebuilt only when the backend data version changes."""
+    return _player_options(get_data_version())
+
+
 def get_teams():
     return _get_df("/teams")
 
@@ -19,6 +194,10 @@ def get_players():
     return _get_df("/players")
 
 
+def search_players(q: str, limit: int = 20):
+    return _get_df("/players/search", params={"q": q, "limit": limit})
+
+
 def get_player(player_id: int):
     return _get_df(f"/players/{player_id}")
 
@@ -35,5 +214,19 @@ def get_top_players(team_id: int, season: str):
     return _get_df("/top-players", params={"team_id": team_id, "season": season})
 
 
+def get_team_page(team_id: int, season: str):
+    cache_stats().record_call()
+    data = _fetch_json("/team-page", (("season", season), ("team_id", team_id)))
+    return {name: pd.DataFrame(rows) for name, rows in data.items()}
+
+
 def get_player_stats(player_id: int):
     return _get_df(f"/player-stats/{player_id}")
+
+
+def get_players_batch(player_ids):
+    return _post_df("/players:batch", player_ids)
+
+
+def get_player_stats_batch(player_ids):
+    return _post_df("/player-stats:batch", player_ids)
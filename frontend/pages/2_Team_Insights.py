@@ -2,10 +2,8 @@ import streamlit as st
 import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from api import get_teams
-from api import get_squads
-from api import get_team_league
-from api import get_top_players
+from api import get_team_options
+from api import get_team_page
 
 
 st.title("Team Insights")
@@ -13,12 +11,7 @@ st.title("Team Insights")
 st.write("Hier kannst du Informationen zu verschiedenen Teams abrufen und analysieren. Entdecke Kader, Statistiken und Leistungsdaten, um dir einen schnellen Überblick zu verschaffen und Teams besser vergleichen zu können.")
 
 # --- Daten laden ---
-teams_df = get_teams()
-
-team_options = {
-    row["club_name"]: row["club_id"]
-    for _, row in teams_df.iterrows()
-}
+team_options = get_team_options()
 
 team_name = st.selectbox("Team auswählen", list(team_options.keys()))
 team_id = team_options[team_name]
@@ -34,7 +27,9 @@ tab1, tab2 = st.tabs([
     "Topspieler"
 ])
 
-league = get_team_league(team_id, season)
+# Liga, Kader und Topspieler kommen in einer Anfrage
+team_page = get_team_page(team_id, season)
+league = team_page["league"]
 
 with tab1:
     st.subheader("Kaderübersicht")
@@ -45,7 +40,7 @@ with tab1:
         league_name = league["league"].values[0]
         st.markdown(f"**Liga:** {league_name}")
         
-        df = get_squads(team_id, season)
+        df = team_page["squad"]
         st.dataframe(df)
 
 
@@ -55,5 +50,5 @@ with tab2:
     if league.empty:
         st.warning("Keine Daten für diese Saison verfügbar.")
     else:
-        df = get_top_players(team_id, season)
+        df = team_page["top_players"]
         st.dataframe(df)
\ No newline at end of file
@@ -2,7 +2,7 @@ import streamlit as st
 import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from api import get_players
+from api import get_player_options
 from api import get_player
 from api import get_player_stats
 
@@ -10,12 +10,7 @@ st.title("Player Insights")
 
 st.write("Hier kannst du detaillierte Informationen zu einzelnen Spielern abrufen. Analysiere Statistiken, Leistungen und Entwicklungen, um Talente besser einschätzen und vergleichen zu können.")
 
-players_df = get_players()
-
-players_options = {
-    row["player_name"]: row["player_id"]
-    for _, row in players_df.iterrows()
-}
+players_options = get_player_options()
 
 player_name = st.selectbox("Spieler auswählen", list(players_options.keys()))
 player_id = players_options[player_name]
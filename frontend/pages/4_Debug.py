@@ -0,0 +1,39 @@
+import streamlit as st
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from api import API_URL
+from api import cache_stats
+from api import clear_cache
+from api import get_json
+
+st.title("🛠️ Debug")
+
+st.write(f"API: {API_URL}")
+
+# --- Frontend Cache ---
+st.subheader("Frontend Cache")
+
+stats = cache_stats().snapshot()
+
+col1, col2, col3, col4 = st.columns(4)
+col1.metric("Aufrufe", stats["calls"])
+col2.metric("Hits", stats["hits"])
+col3.metric("Misses", stats["misses"])
+col4.metric("Hit-Rate", f"{stats['hit_rate']:.0%}")
+
+st.caption(f"TTL: {stats['ttl_s']} s")
+
+if st.button("Cache leeren"):
+    clear_cache()
+    st.success("Frontend-Cache geleert")
+
+# --- Backend ---
+st.subheader("Backend")
+
+for label, path in [("Response Cache", "/metrics/cache"), ("DB Pool", "/metrics/pool")]:
+    try:
+        st.write(f"**{label}**")
+        st.json(get_json(path))
+    except Exception as e:
+        st.warning(f"{path} nicht erreichbar: {e}")
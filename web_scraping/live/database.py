@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import os
+
+import psycopg2
+
+
+def get_connection():
+    return psycopg2.connect(
+        host=os.getenv("DB_HOST"),
+        database=os.getenv("DB_NAME"),
+        user=os.getenv("DB_USER"),
+        password=os.getenv("DB_PASSWORD"),
+        port=os.getenv("DB_PORT"),
+    )
+
+
+def loaded_match_ids() -> set[str]:
+    conn = get_connection()
+    try:
+        with conn, conn.cursor() as cur:
+            cur.execute("SELECT match_id FROM matches")
+            return {str(r[0]) for r in cur.fetchall()}
+    finally:
+        conn.close()
@@ -8,11 +8,16 @@ from pathlib import Path
 
 import pandas as pd
 
+from web_scraping.live.database import loaded_match_ids
 from web_scraping.live.yearly import LEAGUES, get_current_season
 from web_scraping.transfermarkt.scraper.matches import MatchesScraper
 from web_scraping.transfermarkt.scraper.player_stats import PlayerStatsScraper
+from web_scraping.toolkit.logger import Logger
 
-LAST_SCRAPES_PATH = "../runtime/last_scrapes.json"
+RUNTIME_DIR = Path(__file__).resolve().parent.parent / "runtime"
+LAST_SCRAPES_PATH = RUNTIME_DIR / "last_scrapes.json"
+MATCH_MANIFEST_PATH = RUNTIME_DIR / "match_manifest.json"
+DELTA_MATCH_IDS_FILE = "match_ids.json"
 
 def _load_last_scrape_match_date() -> date:
     if not LAST_SCRAPES_PATH.exists():
@@ -67,7 +72,137 @@ def _filter_matches_csv(matches_path: Path, start_date: date, end_date: date) ->
     print(f"[INFO] Matches kept between {start_date} and {end_date}: {len(df)}")
 
 
-def run_weekly() -> None:
+def _load_manifest() -> set[str]:
+    if not MATCH_MANIFEST_PATH.exists():
+        return set()
+
+    with MATCH_MANIFEST_PATH.open("r", encoding="utf-8") as f:
+        return {str(x) for x in json.load(f).get("match_ids", [])}
+
+
+def _save_manifest(match_ids: set[str]) -> None:
+    MATCH_MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with MATCH_MANIFEST_PATH.open("w", encoding="utf-8") as f:
+        json.dump({"match_ids": sorted(match_ids, key=int)}, f)
+
+
+def _delta_root(league_type: str) -> Path:
+    return Path(f"data/scrape/{league_type}/delta")
+
+
+def _pending_match_ids(league_type: str) -> set[str]:
+    """match_ids of completed delta directories that are still on disk."""
+    pending = set()
+    for path in _delta_root(league_type).glob(f"*/{DELTA_MATCH_IDS_FILE}"):
+        with path.open("r", encoding="utf-8") as f:
+            pending |= {str(x) for x in json.load(f).get("match_ids", [])}
+    return pending
+
+
+def _unfinished_delta_dir(league_type: str) -> Path | None:
+    """
+    Newest delta directory without match_ids.json, i.e. left by a crashed run.
+    Reusing it resumes that run from its PlayerStatsScraper checkpoint.
+    """
+    unfinished = [
+        d for d in _delta_root(league_type).glob("*")
+        if d.is_dir() and not (d / DELTA_MATCH_IDS_FILE).exists()
+    ]
+    return max(unfinished, key=lambda d: d.name, default=None)
+
+
+def _known_match_ids(league_type: str) -> set[str]:
+    """
+    match_ids already loaded into the DB, plus those of delta directories
+    that are complete but may not have been loaded yet. The manifest mirrors
+    the DB's match_ids and is only used when the DB is unreachable.
+    """
+    try:
+        loaded = loaded_match_ids()
+        _save_manifest(loaded)
+    except Exception as e:
+        print(f"[WARN] could not read loaded match_ids from DB, using manifest only: {e}")
+        loaded = _load_manifest()
+
+    return loaded | _pending_match_ids(league_type)
+
+
+def run_weekly_incremental(league_type: str = "amateur") -> Path | None:
+    season = get_current_season()
+    known = _known_match_ids(league_type)
+
+    print(f"[INFO] Incremental weekly run started: season={season}, known matches={len(known)}")
+
+    # Only the schedule pages are read in full; they are the source of new match_ids.
+    matches_scraper = MatchesScraper(
+        league=LEAGUES,
+        start_year=season,
+        end_year=season + 1,
+        league_type=league_type,
+    )
+    matches = matches_scraper.collect_matches()
+
+    # Only played matches: a fixture without a result would be loaded with
+    # NULL scores and then never scraped again.
+    played = (
+        (pd.to_datetime(matches["date"], errors="coerce").dt.date <= date.today())
+        & matches["home_goals"].notna()
+        & matches["away_goals"].notna()
+    )
+    new_matches = matches[played & ~matches["match_id"].astype(str).isin(known)].reset_index(drop=True)
+    if new_matches.empty:
+        print("[INFO] No new matches since the last run")
+        return None
+
+    delta_dir = _unfinished_delta_dir(league_type)
+    if delta_dir is None:
+        delta_dir = _delta_root(league_type) / datetime.now().strftime("%Y%m%d-%H%M%S")
+    delta_dir.mkdir(parents=True, exist_ok=True)
+
+    matches_path = delta_dir / "matches.csv"
+    player_stats_path = delta_dir / "player_stats.csv"
+    print(f"[INFO] Writing delta to: {delta_dir}")
+    new_matches.to_csv(matches_path, index=False, encoding="utf-8-sig")
+    print(f"[INFO] {len(new_matches)} new matches saved to: {matches_path}")
+
+    # Only the new reports are fetched, and only the season pages of players
+    # who appear in them.
+    player_stats_scraper = PlayerStatsScraper(
+        league_type=league_type,
+        matches_path=str(matches_path),
+        player_stats_savepath=str(player_stats_path),
+    )
+    player_stats = player_stats_scraper.run()
+
+    # Keep only fully scraped matches in the delta. The others stay unknown
+    # (not in the DB, not in a delta) and are scraped again by the next run.
+    scraped = player_stats_scraper.scraped_match_ids
+    is_scraped = new_matches["match_id"].astype(str).isin(scraped)
+    if not is_scraped.all():
+        print(f"[WARN] {int((~is_scraped).sum())} matches incomplete, left for the next run")
+
+        new_matches = new_matches[is_scraped].reset_index(drop=True)
+        new_matches.to_csv(matches_path, index=False, encoding="utf-8-sig")
+
+        player_stats = player_stats[player_stats["match_id"].astype(str).isin(scraped)]
+        player_stats.to_csv(player_stats_path, index=False, encoding="utf-8-sig")
+
+    Logger().log(new_matches, "matches")
+
+    # Written last: a delta without this file is incomplete and ignored.
+    with (delta_dir / DELTA_MATCH_IDS_FILE).open("w", encoding="utf-8") as f:
+        json.dump({"match_ids": sorted(new_matches["match_id"].astype(str), key=int)}, f)
+
+    print(f"[INFO] Incremental weekly run finished: {delta_dir} ({len(new_matches)} matches)")
+    return delta_dir
+
+
+def run_weekly(incremental: bool = True) -> None:
+    # The derived tables are refreshed by the loader once a delta is loaded.
+    if incremental:
+        run_weekly_incremental()
+        return
+
     season = get_current_season()
     date_today = date.today()
     last_scrape_match_date = _load_last_scrape_match_date()
@@ -108,9 +243,8 @@ def run_weekly() -> None:
     ### Transform ###
 
     ### In DB einlesen ###
+    # containers/transform/load.py refreshes the derived tables after loading.
 
     ### CSV löschen ###
 
-
-
     print("[INFO] Weekly live run finished")
\ No newline at end of file
@@ -14,7 +14,8 @@ LEAGUES = [
     "1_liga_gr_3",
 ]
 
-LAST_SCRAPES_PATH = "../runtime/last_scrapes.json"
+RUNTIME_DIR = Path(__file__).resolve().parent.parent / "runtime"
+LAST_SCRAPES_PATH = RUNTIME_DIR / "last_scrapes.json"
 
 
 def _load_runtime_state() -> dict:
@@ -39,6 +40,15 @@ def get_saved_season() -> int:
     return int(season)
 
 
+def get_current_season() -> int:
+    try:
+        return get_saved_season()
+    except KeyError:
+        # Transfermarkt names a season after the year it starts in (July).
+        today = date.today()
+        return today.year if today.month >= 7 else today.year - 1
+
+
 def run_yearly() -> None:
     date_today = date.today()
     season = date_today.year
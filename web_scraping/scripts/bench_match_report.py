@@ -0,0 +1,108 @@
+"""
+Match report parsing benchmark.
+
+Compares the old per-player path (one BeautifulSoup per
+parse_spielbericht_player_sub_events call, plus one each for the lineup and
+the goals) with MatchReport, which parses the page once, on recorded
+spielbericht pages. Pages are read from a directory of saved ``.html`` /
+``.html.gz`` files or, by default, from the on-disk Transfermarkt response
+cache. Both paths must produce the same goals and substitution events; the
+numbers are process CPU time per match.
+
+Usage:
+    python -m web_scraping.scripts.bench_match_report [--pages DIR] [--cache-dir DIR] [--limit 50] [--repeat 3]
+"""
+
+import argparse
+import gzip
+import json
+import time
+from pathlib import Path
+
+from web_scraping.transfermarkt.cache import ResponseCache
+from web_scraping.transfermarkt.parser.match_report import MatchReport
+from web_scraping.transfermarkt.parser.player_stats import PlayerStatsParser
+
+
+def _read(path):
+    data = path.read_bytes()
+    if path.suffix == ".gz":
+        data = gzip.decompress(data)
+    return data.decode("utf-8")
+
+
+def pages_from_dir(directory, limit):
+    paths = sorted(Path(directory).glob("*.html")) + sorted(Path(directory).glob("*.html.gz"))
+    return [_read(p) for p in paths[:limit]]
+
+
+def pages_from_cache(cache_dir, limit):
+    cache = ResponseCache(cache_dir)
+    pages = []
+    for entry_path in sorted((Path(cache_dir) / "urls").glob("*/*.json")):
+        url = json.loads(entry_path.read_text(encoding="utf-8")).get("url", "")
+        if "/spielbericht/" not in url:
+            continue
+
+        entry = cache.get(url)
+        if entry is not None:
+            pages.append(entry["body"])
+        if len(pages) >= limit:
+            break
+    return pages
+
+
+def old_path(parser, html):
+    refs = parser.parse_spielbericht_player_refs(html)
+    goals = parser.parse_spielbericht_goals(html)
+    subs = {r["player_id"]: parser.parse_spielbericht_player_sub_events(html, r["player_id"]) for r in refs}
+    return refs, goals, subs
+
+
+def new_path(parser, html):
+    report = MatchReport(html, parser)
+    subs = {r["player_id"]: report.sub_events(r["player_id"]) for r in report.player_refs}
+    return report.player_refs, report.goals, subs
+
+
+def cpu_per_match(fn, parser, pages, repeat):
+    started = time.process_time()
+    for _ in range(repeat):
+        for html in pages:
+            fn(parser, html)
+    return (time.process_time() - started) / (repeat * len(pages))
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pages", help="directory of saved spielbericht pages (.html / .html.gz)")
+    ap.add_argument("--cache-dir", default="data/cache/transfermarkt")
+    ap.add_argument("--limit", type=int, default=50)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    pages = pages_from_dir(args.pages, args.limit) if args.pages else pages_from_cache(args.cache_dir, args.limit)
+    if not pages:
+        raise SystemExit("no recorded spielbericht pages found")
+
+    parser = PlayerStatsParser()
+
+    mismatches = 0
+    for html in pages:
+        _old_refs, old_goals, old_subs = old_path(parser, html)
+        _new_refs, new_goals, new_subs = new_path(parser, html)
+        if old_goals != new_goals or any(new_subs.get(pid) != ev for pid, ev in old_subs.items()):
+            mismatches += 1
+
+    old_s = cpu_per_match(old_path, parser, pages, args.repeat)
+    new_s = cpu_per_match(new_path, parser, pages, args.repeat)
+
+    print(f"pages:       {len(pages)}")
+    print(f"mismatches:  {mismatches}")
+    print(f"per-player:  {old_s * 1000:8.1f} ms/match")
+    print(f"MatchReport: {new_s * 1000:8.1f} ms/match")
+    print(f"speedup:     {old_s / new_s:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,8 @@ from web_scraping.transfermarkt.scraper.clubs import ClubsScraper
 from web_scraping.transfermarkt.scraper.matches import MatchesScraper
 from web_scraping.transfermarkt.scraper.player_stats import PlayerStatsScraper
 from web_scraping.transfermarkt.scraper.players import PlayersScraper
+from web_scraping.transfermarkt.cache import get_response_cache
+from web_scraping.transfermarkt.ratelimit import rate_limit_stats
 
 
 PARAMS = {
@@ -35,6 +37,13 @@ def run_pro_scrape() -> None:
     player_stats_scraper = PlayerStatsScraper(league_type=PARAMS["league_type"])
     player_stats_scraper.run()
 
+    for host, stats in rate_limit_stats().items():
+        print(f"Rate limit {host}: {stats}")
+
+    cache = get_response_cache()
+    if cache is not None:
+        print(f"Response cache: {cache.stats()}")
+
 
 if __name__ == "__main__":
     run_pro_scrape()
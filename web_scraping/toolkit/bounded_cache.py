@@ -0,0 +1,143 @@
+import hashlib
+import pickle
+import shutil
+import sys
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+
+
+def _sizeof(value) -> int:
+    # Shallow on purpose: exact for strings and bytes, a cheap lower bound for
+    # containers. Callers that cache nested structures pass ``size`` to put().
+    return sys.getsizeof(value)
+
+
+class BoundedCache:
+    """
+    Dict-like LRU cache bounded by the estimated size of its values in bytes.
+
+    When the bound is exceeded, the least recently used entries are evicted.
+    With ``spill_dir`` set they are pickled to disk instead and transparently
+    loaded back on the next access; without it they are simply dropped and
+    the caller recomputes them.
+
+    Sizes come from ``sizeof`` unless the caller knows better and passes
+    ``size`` to ``put``, e.g. the length of the page a parsed value came from.
+    """
+
+    def __init__(self, max_bytes: int, spill_dir=None, sizeof=_sizeof):
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+
+        self._data = OrderedDict()
+        self._sizes = {}
+        self.nbytes = 0
+
+        self._spill_dir = None
+        self._spilled = {}
+        if spill_dir is not None:
+            Path(spill_dir).mkdir(parents=True, exist_ok=True)
+            self._spill_dir = Path(tempfile.mkdtemp(dir=spill_dir, prefix="spill-"))
+
+        self.evictions = 0
+        self.spill_loads = 0
+
+    def _spill_path(self, key) -> Path:
+        return self._spill_dir / hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+
+    def _evict(self):
+        while self.nbytes > self.max_bytes and len(self._data) > 1:
+            key, value = self._data.popitem(last=False)
+            size = self._sizes.pop(key)
+            self.nbytes -= size
+            self.evictions += 1
+
+            if self._spill_dir is not None:
+                with self._spill_path(key).open("wb") as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                self._spilled[key] = size
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def put(self, key, value, size: int | None = None):
+        """Store ``value``; ``size`` overrides the ``sizeof`` estimate."""
+        self.pop(key, None)
+
+        if size is None:
+            size = self.sizeof(value)
+        self._data[key] = value
+        self._sizes[key] = size
+        self.nbytes += size
+        self._evict()
+
+    def __getitem__(self, key):
+        if key in self._data:
+            self._data.move_to_end(key)
+            return self._data[key]
+
+        if key in self._spilled:
+            path = self._spill_path(key)
+            with path.open("rb") as f:
+                value = pickle.load(f)
+            path.unlink(missing_ok=True)
+            size = self._spilled.pop(key)
+            self.spill_loads += 1
+
+            self.put(key, value, size)
+            return value
+
+        raise KeyError(key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._data or key in self._spilled
+
+    def __len__(self) -> int:
+        return len(self._data) + len(self._spilled)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def pop(self, key, default=None):
+        if key in self._data:
+            self.nbytes -= self._sizes.pop(key)
+            return self._data.pop(key)
+
+        if key in self._spilled:
+            value = self[key]
+            return self.pop(key, value)
+
+        return default
+
+    def update(self, items):
+        for key, value in dict(items).items():
+            self[key] = value
+
+    def clear(self):
+        self._data.clear()
+        self._sizes.clear()
+        self.nbytes = 0
+        self._spilled.clear()
+        if self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir.mkdir(parents=True, exist_ok=True)
+
+    def close(self):
+        """Drop all entries and remove the spill directory."""
+        self.clear()
+        if self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._data),
+            "spilled": len(self._spilled),
+            "nbytes": self.nbytes,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+            "spill_loads": self.spill_loads,
+        }
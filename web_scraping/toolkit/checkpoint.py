@@ -0,0 +1,81 @@
+import json
+import sqlite3
+from pathlib import Path
+
+
+class Checkpoint:
+    """
+    SQLite checkpoint of a long-running scrape.
+
+    Keeps the IDs of finished items, the rows they produced and arbitrary
+    keyed intermediate results (e.g. parsed player-season pages). Each
+    ``save`` is one transaction, so a crash leaves the store at the last
+    completed batch.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(self.path)
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS done (
+                item_id TEXT PRIMARY KEY
+            );
+            CREATE TABLE IF NOT EXISTS rows (
+                item_id TEXT NOT NULL,
+                row TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS results (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            """
+        )
+
+    def done_ids(self) -> set[str]:
+        return {r[0] for r in self.conn.execute("SELECT item_id FROM done")}
+
+    def rows(self) -> list[dict]:
+        return [json.loads(r[0]) for r in self.conn.execute("SELECT row FROM rows ORDER BY rowid")]
+
+    def results(self) -> dict:
+        return {
+            tuple(json.loads(k)): json.loads(v)
+            for k, v in self.conn.execute("SELECT key, value FROM results")
+        }
+
+    def save(self, done: dict[str, list[dict]], results: dict | None = None):
+        """Record ``done`` (item_id -> rows) and ``results`` (tuple key -> JSON value) atomically."""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO done (item_id) VALUES (?)",
+                [(item_id,) for item_id in done],
+            )
+            self.conn.executemany(
+                "INSERT INTO rows (item_id, row) VALUES (?, ?)",
+                [
+                    (item_id, json.dumps(row))
+                    for item_id, item_rows in done.items()
+                    for row in item_rows
+                ],
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)",
+                [(json.dumps(list(k)), json.dumps(v)) for k, v in (results or {}).items()],
+            )
+
+    def discard(self, item_ids):
+        """Forget finished items and their rows, e.g. when their input changed."""
+        with self.conn:
+            self.conn.executemany("DELETE FROM done WHERE item_id = ?", [(i,) for i in item_ids])
+            self.conn.executemany("DELETE FROM rows WHERE item_id = ?", [(i,) for i in item_ids])
+
+    def close(self):
+        self.conn.close()
+
+    def clear(self):
+        """Drop the checkpoint once its output has been written."""
+        self.close()
+        self.path.unlink(missing_ok=True)
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import datetime
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+
+class ResponseCache:
+    """
+    On-disk cache of Transfermarkt pages.
+
+    Bodies are gzip-compressed and stored content-addressed under
+    ``blobs/<sha256 of body>``; a small JSON entry under ``urls/<sha256 of
+    url>`` maps a URL to its current body and fetch time. Identical pages
+    are stored once, and writes go through a rename so concurrent scrapers
+    never see half-written files.
+
+    Pages of a past season never expire. Pages of the current season, and
+    pages whose season is unknown, go stale after ``ttl`` seconds and are
+    then revalidated with the ``ETag`` / ``Last-Modified`` validators kept in
+    their entry. The season is read from ``saison_id`` / ``saison`` in the
+    URL unless the caller passes it explicitly (e.g. for ``spielbericht``
+    pages).
+    """
+
+    DEFAULT_TTL = 24 * 60 * 60
+
+    _RE_SEASON = re.compile(r"(?:[?&/]saison_id[=/]|/saison/)(\d{4})")
+
+    def __init__(
+        self,
+        root: str | Path,
+        ttl: float = DEFAULT_TTL,
+        current_season: int | None = None,
+    ):
+        self.root = Path(root)
+        self.ttl = ttl
+        self.current_season = current_season if current_season is not None else self._current_season()
+
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.revalidated_count = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _current_season() -> int:
+        # Transfermarkt names a season after the year it starts in (July).
+        today = datetime.date.today()
+        return today.year if today.month >= 7 else today.year - 1
+
+    @staticmethod
+    def _digest(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def _entry_path(self, url: str) -> Path:
+        key = self._digest(url.encode("utf-8"))
+        return self.root / "urls" / key[:2] / f"{key}.json"
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.root / "blobs" / digest[:2] / f"{digest}.html.gz"
+
+    def _write_atomic(self, path: Path, data: bytes):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def _count(self, **deltas):
+        with self._lock:
+            for k, v in deltas.items():
+                setattr(self, k, getattr(self, k) + v)
+
+    def season_of(self, url: str, season: int | None = None) -> int | None:
+        if season is not None:
+            return int(season)
+        m = self._RE_SEASON.search(url)
+        return int(m.group(1)) if m else None
+
+    def is_fresh(self, entry: dict) -> bool:
+        season = entry.get("season")
+        if season is not None and int(season) < self.current_season:
+            return True
+        return time.time() - float(entry.get("fetched_at", 0)) < self.ttl
+
+    def _read_entry(self, url: str) -> dict | None:
+        try:
+            entry = json.loads(self._entry_path(url).read_text(encoding="utf-8"))
+            entry["body"] = gzip.decompress(self._blob_path(entry["digest"]).read_bytes()).decode("utf-8")
+        except (OSError, ValueError, KeyError):
+            return None
+        return entry
+
+    def _write_entry(self, entry: dict):
+        data = {k: v for k, v in entry.items() if k != "body"}
+        self._write_atomic(self._entry_path(entry["url"]), json.dumps(data).encode("utf-8"))
+
+    def get(self, url: str) -> dict | None:
+        """
+        Return the cached entry for ``url`` or None.
+
+        The entry carries the ``body`` and ``fresh``. A stale entry is still
+        returned so the caller can revalidate it with ``validators()``.
+        """
+        entry = self._read_entry(url)
+        if entry is None:
+            self._count(misses=1)
+            return None
+
+        entry["fresh"] = self.is_fresh(entry)
+        self._count(**({"hits": 1} if entry["fresh"] else {"stale": 1}))
+        return entry
+
+    @staticmethod
+    def validators(entry: dict | None) -> dict:
+        """Conditional request headers for a stale entry."""
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def revalidated(self, entry: dict) -> str:
+        """Mark a stale entry as fresh after a 304 and return its body."""
+        entry = {k: v for k, v in entry.items() if k != "fresh"}
+        entry["fetched_at"] = time.time()
+        self._write_entry(entry)
+        self._count(revalidated_count=1)
+        return entry["body"]
+
+    def put(
+        self,
+        url: str,
+        body: str,
+        season: int | None = None,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> dict:
+        data = body.encode("utf-8")
+        digest = self._digest(data)
+
+        blob = self._blob_path(digest)
+        if not blob.exists():
+            self._write_atomic(blob, gzip.compress(data, compresslevel=6))
+
+        entry = {
+            "url": url,
+            "digest": digest,
+            "season": self.season_of(url, season),
+            "fetched_at": time.time(),
+            "size": len(data),
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+        self._write_entry(entry)
+        return entry
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "root": str(self.root),
+                "ttl_s": self.ttl,
+                "current_season": self.current_season,
+                "hits": self.hits,
+                "misses": self.misses,
+                "stale": self.stale,
+                "revalidated": self.revalidated_count,
+            }
+
+
+_default_cache: ResponseCache | None = None
+_default_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache | None:
+    """Process-wide cache shared by every HttpClient (TM_CACHE_DIR, TM_CACHE_TTL, TM_CURRENT_SEASON; TM_CACHE=0 disables it)."""
+    global _default_cache
+
+    if os.getenv("TM_CACHE", "1") == "0":
+        return None
+
+    with _default_lock:
+        if _default_cache is None:
+            season = os.getenv("TM_CURRENT_SEASON")
+            _default_cache = ResponseCache(
+                root=os.getenv("TM_CACHE_DIR", "data/cache/transfermarkt"),
+                ttl=float(os.getenv("TM_CACHE_TTL", ResponseCache.DEFAULT_TTL)),
+                current_season=int(season) if season else None,
+            )
+        return _default_cache
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import random
+import threading
 import time
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from web_scraping.transfermarkt.cache import ResponseCache, get_response_cache
+from web_scraping.transfermarkt.ratelimit import RateLimiter, get_rate_limiter
+
 class HttpClient:
 
     DEFAULT_CONNECT_TIMEOUT = 10
@@ -14,7 +18,8 @@ class HttpClient:
     DEFAULT_TOTAL_RETRIES = 5
     DEFAULT_BACKOFF_FACTOR = 1.0
 
-    STATUS_FORCELIST = (429, 500, 502, 503, 504)
+    # 429 is handled in get() so the shared rate limiter sees every throttle.
+    STATUS_FORCELIST = (500, 502, 503, 504)
 
     def __init__(
         self,
@@ -24,6 +29,9 @@ class HttpClient:
         backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
         status_forcelist: tuple[int, ...] = STATUS_FORCELIST,
         max_attempts: int = 2,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        use_cache: bool = True,
     ):
         self.connect_timeout = connect_timeout
         self.read_timeout = read_timeout
@@ -33,8 +41,20 @@ class HttpClient:
         self.backoff_factor = backoff_factor
         self.status_forcelist = status_forcelist
         self.max_attempts = max_attempts
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.cache = (cache or get_response_cache()) if use_cache else None
+
+        # requests.Session is not thread-safe; each worker thread of a
+        # ConcurrentFetcher gets its own session (and connection pool).
+        self._local = threading.local()
 
-        self.session = self._make_session()
+    @property
+    def session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._make_session()
+            self._local.session = session
+        return session
 
     def _make_session(self) -> requests.Session:
 
@@ -69,22 +89,50 @@ class HttpClient:
 
         return s
 
-    def get(self, url: str) -> str:
+    def get(self, url: str, season: int | None = None) -> str:
+        """
+        Return the page at ``url``, from the response cache if possible.
+
+        ``season`` overrides the season read from the URL when deciding
+        whether a cached page can still change.
+        """
+        entry = self.cache.get(url) if self.cache is not None else None
+        if entry is not None and entry["fresh"]:
+            return entry["body"]
+
+        r = self._fetch(url, self.cache.validators(entry) if entry is not None else None)
+
+        if r.status_code == 304 and entry is not None:
+            return self.cache.revalidated(entry)
+
+        html = r.text
+        if self.cache is not None:
+            self.cache.put(
+                url,
+                html,
+                season,
+                etag=r.headers.get("ETag"),
+                last_modified=r.headers.get("Last-Modified"),
+            )
+        return html
+
+    def _fetch(self, url: str, headers: dict | None = None) -> requests.Response:
 
         last_exc: Exception | None = None
 
         for attempt in range(1, self.max_attempts + 1):
 
             try:
-                r = self.session.get(url, timeout=self.timeout)
+                self.rate_limiter.acquire(url)
+                r = self.session.get(url, headers=headers, timeout=self.timeout)
 
                 if r.status_code == 429:
                     ra = (r.headers.get("Retry-After") or "").strip()
                     wait_s = int(ra) if ra.isdigit() else min(60, 5 * attempt)
-                    time.sleep(wait_s)
+                    self.rate_limiter.throttled(url, wait_s)
 
                 r.raise_for_status()
-                return r.text
+                return r
 
             except requests.exceptions.RequestException as e:
 
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import re
+
+from web_scraping.transfermarkt.parser.player_stats import PlayerStatsParser
+
+
+class MatchReport:
+    """
+    A ``spielbericht`` page parsed once.
+
+    Lineup references, goals and the substitution events of every player in
+    the event list are extracted from a single BeautifulSoup tree when the
+    report is built; ``sub_events`` is then a dictionary lookup. Players
+    without an event in the list fall back to the raw-HTML minute windows
+    exactly like ``PlayerStatsParser.parse_spielbericht_player_sub_events``;
+    the windows are cut once and indexed by the player IDs they mention.
+    """
+
+    _RE_SPIELER_ID = re.compile(r"/spieler/(\d+)")
+
+    def __init__(self, html: str, parser: PlayerStatsParser | None = None, match_id: str | None = None):
+        self.parser = parser or PlayerStatsParser()
+        self.html = html.replace("\\/", "/")
+
+        soup = self.parser._soup(self.html)
+        self.player_refs: list[dict] = self.parser._player_refs_from_soup(soup)
+
+        # Goals and substitutions fail independently of the lineup, as with
+        # the per-call parser methods: the match is kept without them.
+        try:
+            self.goals: list[tuple[int, str]] = self.parser._goals_from_soup(soup, self.html)
+        except Exception as e:
+            print(f"[WARN] goals parsing failed: match_id={match_id}, error={e}")
+            self.goals = []
+
+        try:
+            self._li_events: dict[str, list[tuple[int, str]]] | None = self.parser._sub_events_by_player(soup)
+        except Exception as e:
+            print(f"[WARN] sub events failed: match_id={match_id}, error={e}")
+            self._li_events = None
+
+        self._windows: list[tuple[int, str]] | None = None
+        self._windows_by_player: dict[str, list[int]] = {}
+        self._window_events: dict[str, list[tuple[int, str]]] = {}
+
+    def _index_windows(self):
+        self._windows = list(self.parser._iter_minute_windows(self.html))
+        for i, (_minute, window) in enumerate(self._windows):
+            for pid in dict.fromkeys(self._RE_SPIELER_ID.findall(window)):
+                self._windows_by_player.setdefault(pid, []).append(i)
+
+    def sub_events(self, player_id: str) -> list[tuple[int, str]]:
+        player_id = str(player_id)
+
+        if self._li_events is None:
+            return []
+
+        events = self._li_events.get(player_id)
+        if events:
+            return events
+
+        if player_id not in self._window_events:
+            if self._windows is None:
+                self._index_windows()
+
+            out: set[tuple[int, str]] = set()
+            for i in self._windows_by_player.get(player_id, ()):
+                minute, window = self._windows[i]
+                ev = self.parser._extract_sub_event_from_window(window, minute, player_id)
+                if ev is not None:
+                    out.add((int(ev[0]), ev[1]))
+            self._window_events[player_id] = self.parser._sort_sub_events(list(out))
+
+        return self._window_events[player_id]
@@ -295,8 +295,9 @@ class PlayerStatsParser:
         return out
 
     def parse_spielbericht_player_refs(self, html: str) -> list[dict]:
-        soup = self._soup(html)
+        return self._player_refs_from_soup(self._soup(html))
 
+    def _player_refs_from_soup(self, soup: BeautifulSoup) -> list[dict]:
         start_tag = None
         for tag in soup.find_all(["h1", "h2", "h3", "div", "span"]):
             txt = tag.get_text(" ", strip=True)
@@ -398,8 +399,27 @@ class PlayerStatsParser:
 
     def parse_spielbericht_goals(self, html: str) -> list[tuple[int, str]]:
         html = html.replace("\\/", "/")
-        soup = self._soup(html)
-
+        return self._goals_from_soup(self._soup(html), html)
+
+    def _iter_minute_windows(self, html: str):
+        for m in self._RE_UHR.finditer(html):
+            base = int(m.group(1))
+            extra = int(m.group(2)) if m.group(2) else 0
+            minute = base + extra
+            start = max(0, m.start() - 900)
+            end = min(len(html), m.end() + 900)
+            yield minute, html[start:end]
+
+        low = html.lower()
+        for m in self._RE_MIN_DOT.finditer(low):
+            base = int(m.group(1))
+            extra = int(m.group(2)) if m.group(2) else 0
+            minute = base + extra
+            start = max(0, m.start() - 900)
+            end = min(len(low), m.end() + 900)
+            yield minute, html[start:end]
+
+    def _goals_from_soup(self, soup: BeautifulSoup, html: str) -> list[tuple[int, str]]:
         out: list[tuple[int, str]] = []
         seen: set[tuple[int, str]] = set()
 
@@ -438,25 +458,7 @@ class PlayerStatsParser:
         out2: list[tuple[int, str]] = []
         seen2: set[tuple[int, str]] = set()
 
-        def iter_windows():
-            for m in self._RE_UHR.finditer(html):
-                base = int(m.group(1))
-                extra = int(m.group(2)) if m.group(2) else 0
-                minute = base + extra
-                start = max(0, m.start() - 900)
-                end = min(len(html), m.end() + 900)
-                yield minute, html[start:end]
-
-            low = html.lower()
-            for m in self._RE_MIN_DOT.finditer(low):
-                base = int(m.group(1))
-                extra = int(m.group(2)) if m.group(2) else 0
-                minute = base + extra
-                start = max(0, m.start() - 900)
-                end = min(len(low), m.end() + 900)
-                yield minute, html[start:end]
-
-        for minute, window in iter_windows():
+        for minute, window in self._iter_minute_windows(html):
             wlow = window.lower()
             if "tor" not in wlow:
                 continue
@@ -566,11 +568,7 @@ class PlayerStatsParser:
 
         out: set[tuple[int, str]] = set()
 
-        lis = soup.select("#sb-wechsel li")
-        if not lis:
-            lis = soup.select("div.sb-ereignisse li")
-
-        for li in lis:
+        for li in self._sub_event_lis(soup):
             ev = self._extract_sub_event_from_li(li, player_id)
             if ev is not None:
                 out.add((int(ev[0]), ev[1]))
@@ -578,31 +576,36 @@ class PlayerStatsParser:
         if out:
             return self._sort_sub_events(list(out))
 
-        def iter_windows():
-            for m in self._RE_UHR.finditer(html):
-                base = int(m.group(1))
-                extra = int(m.group(2)) if m.group(2) else 0
-                minute = base + extra
-                start = max(0, m.start() - 900)
-                end = min(len(html), m.end() + 900)
-                yield minute, html[start:end]
-
-            low = html.lower()
-            for m in self._RE_MIN_DOT.finditer(low):
-                base = int(m.group(1))
-                extra = int(m.group(2)) if m.group(2) else 0
-                minute = base + extra
-                start = max(0, m.start() - 900)
-                end = min(len(low), m.end() + 900)
-                yield minute, html[start:end]
-
-        for minute, window in iter_windows():
+        for minute, window in self._iter_minute_windows(html):
             ev = self._extract_sub_event_from_window(window, minute, player_id)
             if ev is not None:
                 out.add((int(ev[0]), ev[1]))
 
         return self._sort_sub_events(list(out))
 
+    def _sub_event_lis(self, soup: BeautifulSoup) -> list:
+        lis = soup.select("#sb-wechsel li")
+        if not lis:
+            lis = soup.select("div.sb-ereignisse li")
+        return lis
+
+    def _sub_events_by_player(self, soup: BeautifulSoup) -> dict[str, list[tuple[int, str]]]:
+        """Substitution events of every player named in the event list, in one pass."""
+        out: dict[str, set[tuple[int, str]]] = {}
+
+        for li in self._sub_event_lis(soup):
+            candidates = {
+                pid
+                for pid in (self._href_to_player_id(a.get("href")) for a in li.select('a[href*="/spieler/"]'))
+                if pid is not None
+            }
+            for pid in candidates:
+                ev = self._extract_sub_event_from_li(li, pid)
+                if ev is not None:
+                    out.setdefault(pid, set()).add((int(ev[0]), ev[1]))
+
+        return {pid: self._sort_sub_events(list(events)) for pid, events in out.items()}
+
     def parse_spielbericht_player_sub_minutes(self, html: str, player_id: str) -> list[int]:
         events = self.parse_spielbericht_player_sub_events(html, player_id)
         return sorted({int(minute) for minute, _kind in events})
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.parse import urlsplit
+
+try:
+    import fcntl
+except ImportError:  # no flock on Windows: buckets are then shared per process only
+    fcntl = None
+
+
+class TokenBucket:
+    """
+    Token bucket whose state lives in a small JSON file.
+
+    Every ``acquire`` takes an exclusive ``flock`` on the file, refills the
+    bucket from the wall clock, reserves one token and releases the lock
+    before sleeping. All HttpClient instances of all processes that point at
+    the same file therefore share one budget of ``rate`` requests per second
+    (bursts up to ``burst``). Reservations may drive the bucket negative,
+    which queues later callers behind earlier ones instead of letting them
+    race for the next token.
+
+    The file also keeps global request / throttle counters so any process can
+    report the throttle rate of the whole scrape.
+    """
+
+    def __init__(self, path: Path, rate: float, burst: float):
+        self.path = Path(path)
+        self.rate = float(rate)
+        self.burst = float(burst)
+
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    @contextmanager
+    def _state(self):
+        with self._lock, open(self.path, "a+", encoding="utf-8") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                raw = f.read()
+                try:
+                    state = json.loads(raw) if raw else {}
+                except ValueError:
+                    state = {}
+
+                now = time.time()
+                tokens = float(state.get("tokens", self.burst))
+                updated = float(state.get("updated", now))
+                state["tokens"] = min(self.burst, tokens + max(0.0, now - updated) * self.rate)
+                state["updated"] = now
+
+                yield state
+
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+                f.flush()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def acquire(self) -> float:
+        """Reserve one request and sleep until it is due. Returns the wait in seconds."""
+        with self._state() as state:
+            state["tokens"] -= 1.0
+            state["requests"] = int(state.get("requests", 0)) + 1
+            wait_s = max(0.0, -state["tokens"] / self.rate)
+
+        if wait_s > 0:
+            time.sleep(wait_s)
+        return wait_s
+
+    def penalize(self, seconds: float):
+        """Record a throttled response and hold every caller back for ``seconds``."""
+        with self._state() as state:
+            state["tokens"] = min(state["tokens"], -float(seconds) * self.rate)
+            state["throttled"] = int(state.get("throttled", 0)) + 1
+
+    def snapshot(self) -> dict:
+        with self._state() as state:
+            return dict(state)
+
+
+class RateLimiter:
+    """Per-host token buckets plus the throttle metrics of this process."""
+
+    # Conservative budget shared by all processes; it also caps the
+    # ConcurrentFetcher (see its defaults). Raise with TM_RATE_LIMIT /
+    # TM_RATE_BURST if Transfermarkt tolerates more.
+    DEFAULT_RATE = 2.0
+    DEFAULT_BURST = 4.0
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: float = DEFAULT_BURST,
+        state_dir: str | Path | None = None,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.state_dir = Path(state_dir or Path(tempfile.gettempdir()) / "tm_ratelimit")
+
+        self._buckets: dict[str, TokenBucket] = {}
+        self._counts: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, url: str) -> tuple[str, TokenBucket]:
+        host = urlsplit(url).netloc or "default"
+
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.state_dir / f"{host}.json", self.rate, self.burst)
+                self._buckets[host] = bucket
+                self._counts[host] = {"requests": 0, "throttled": 0, "waits": 0, "wait_time": 0.0}
+
+        return host, bucket
+
+    def _count(self, host: str, **deltas):
+        with self._lock:
+            counts = self._counts[host]
+            for k, v in deltas.items():
+                counts[k] += v
+
+    def acquire(self, url: str) -> float:
+        host, bucket = self._bucket(url)
+        wait_s = bucket.acquire()
+        self._count(host, requests=1, waits=int(wait_s > 0), wait_time=wait_s)
+        return wait_s
+
+    def throttled(self, url: str, retry_after: float):
+        host, bucket = self._bucket(url)
+        bucket.penalize(retry_after)
+        self._count(host, throttled=1)
+
+    def stats(self) -> dict:
+        """
+        Throttle metrics per host: ``process`` counts this process only,
+        ``shared`` is read from the bucket file and covers all processes.
+        """
+        with self._lock:
+            hosts = {host: (self._buckets[host], dict(counts)) for host, counts in self._counts.items()}
+
+        out = {}
+        for host, (bucket, counts) in hosts.items():
+            shared = bucket.snapshot()
+            shared_requests = int(shared.get("requests", 0))
+            shared_throttled = int(shared.get("throttled", 0))
+
+            out[host] = {
+                "rate": bucket.rate,
+                "burst": bucket.burst,
+                "process": {
+                    **counts,
+                    "throttle_rate": counts["throttled"] / counts["requests"] if counts["requests"] else 0.0,
+                },
+                "shared": {
+                    "requests": shared_requests,
+                    "throttled": shared_throttled,
+                    "throttle_rate": shared_throttled / shared_requests if shared_requests else 0.0,
+                    "tokens": round(float(shared["tokens"]), 3),
+                },
+            }
+        return out
+
+
+_default_limiter: RateLimiter | None = None
+_default_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Process-wide limiter shared by every HttpClient (TM_RATE_LIMIT, TM_RATE_BURST, TM_RATE_STATE_DIR)."""
+    global _default_limiter
+
+    with _default_lock:
+        if _default_limiter is None:
+            _default_limiter = RateLimiter(
+                rate=float(os.getenv("TM_RATE_LIMIT", RateLimiter.DEFAULT_RATE)),
+                burst=float(os.getenv("TM_RATE_BURST", RateLimiter.DEFAULT_BURST)),
+                state_dir=os.getenv("TM_RATE_STATE_DIR") or None,
+            )
+        return _default_limiter
+
+
+def rate_limit_stats() -> dict:
+    return get_rate_limiter().stats()
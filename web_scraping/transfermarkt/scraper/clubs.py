@@ -2,6 +2,7 @@ import pandas as pd
 
 from web_scraping.transfermarkt.parser.clubs import ClubsParser
 from web_scraping.transfermarkt.client import HttpClient
+from web_scraping.transfermarkt.fetcher import ConcurrentFetcher
 from web_scraping.toolkit.logger import Logger
 
 
@@ -26,6 +27,7 @@ class ClubsScraper:
         self.cps_savepath = f"data/scrape/{league_type}/clubs_per_season.csv"
 
         self.client = HttpClient()
+        self.fetcher = ConcurrentFetcher(self.client)
         self.parser = ClubsParser()
 
     def collect_clubs(self):
@@ -74,34 +76,45 @@ class ClubsScraper:
         if not hasattr(self, "clubs") or self.clubs.empty:
             raise ValueError("Run collect_clubs() first.")
 
+        clubs = [
+            (str(row.club_id).strip(), str(row.club_slug).strip())
+            for row in self.clubs.itertuples(index=False)
+        ]
+
         plz_list = []
         location_list = []
 
-        for row in self.clubs.itertuples(index=False):
-            club_id = str(row.club_id).strip()
-            slug = str(row.club_slug).strip()
-
+        location_urls = [self.location_url.format(slug=slug, club_id=club_id) for club_id, slug in clubs]
+        for (club_id, slug), (_url, html, e) in zip(clubs, self.fetcher.fetch_all(location_urls)):
             plz = None
             location = None
 
-            url_location = self.location_url.format(slug=slug, club_id=club_id)
             try:
-                html = self.client.get(url_location)
+                if e is not None:
+                    raise e
                 plz, location = self.parser.parse_plz_location(html)
             except Exception as e:
                 print(f"[WARN] facts failed for club_id={club_id}, slug={slug}: {e}")
 
-            if not (plz and location):
-                url_stadium = self.stadium_url.format(slug=slug, club_id=club_id)
-                try:
-                    html = self.client.get(url_stadium)
-                    plz, location = self.parser.parse_plz_location_stadium(html)
-                except Exception as e:
-                    print(f"[WARN] stadium failed for club_id={club_id}, slug={slug}: {e}")
-
             plz_list.append(plz)
             location_list.append(location)
 
+        # Fall back to the stadium page for clubs without a complete address.
+        missing = [i for i in range(len(clubs)) if not (plz_list[i] and location_list[i])]
+        stadium_urls = [
+            self.stadium_url.format(slug=clubs[i][1], club_id=clubs[i][0])
+            for i in missing
+        ]
+        for i, (_url, html, e) in zip(missing, self.fetcher.fetch_all(stadium_urls)):
+            club_id, slug = clubs[i]
+
+            try:
+                if e is not None:
+                    raise e
+                plz_list[i], location_list[i] = self.parser.parse_plz_location_stadium(html)
+            except Exception as e:
+                print(f"[WARN] stadium failed for club_id={club_id}, slug={slug}: {e}")
+
         self.clubs["PLZ"] = plz_list
         self.clubs["location"] = location_list
         self.clubs = self.clubs[["club_id", "club_name", "PLZ", "location", "club_slug"]]
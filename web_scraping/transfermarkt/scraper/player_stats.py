@@ -2,12 +2,28 @@ from pathlib import Path
 import pandas as pd
 
 from web_scraping.transfermarkt.client import HttpClient
+from web_scraping.transfermarkt.fetcher import ConcurrentFetcher
+from web_scraping.transfermarkt.parser.match_report import MatchReport
 from web_scraping.transfermarkt.parser.player_stats import PlayerStatsParser
+from web_scraping.toolkit.bounded_cache import BoundedCache
+from web_scraping.toolkit.checkpoint import Checkpoint
 from web_scraping.toolkit.logger import Logger
 
 
 class PlayerStatsScraper:
-    def __init__(self, league_type="amateur"):
+
+    DEFAULT_MATCH_HTML_CACHE_BYTES = 64 * 1024 * 1024
+    DEFAULT_PLAYER_SEASON_CACHE_BYTES = 128 * 1024 * 1024
+
+    def __init__(
+        self,
+        league_type="amateur",
+        match_html_cache_bytes: int = DEFAULT_MATCH_HTML_CACHE_BYTES,
+        player_season_cache_bytes: int = DEFAULT_PLAYER_SEASON_CACHE_BYTES,
+        spill_dir: str | None = None,
+        matches_path: str | None = None,
+        player_stats_savepath: str | None = None,
+    ):
         self.base_url = "https://www.transfermarkt.ch"
         self.match_url = "https://www.transfermarkt.ch/{matches_slug}/index/spielbericht/{match_id}"
         self.player_stat_url = (
@@ -15,15 +31,22 @@ class PlayerStatsScraper:
         )
         self.league_type = league_type
 
-        self.matches_path = f"data/scrape/{league_type}/matches.csv"
-        self.player_stats_savepath = f"data/scrape/{league_type}/player_stats.csv"
+        self.matches_path = matches_path or f"data/scrape/{league_type}/matches.csv"
+        self.player_stats_savepath = player_stats_savepath or f"data/scrape/{league_type}/player_stats.csv"
+        self.checkpoint_path = str(Path(self.player_stats_savepath).with_suffix(".checkpoint.sqlite"))
 
         self.client = HttpClient()
+        self.fetcher = ConcurrentFetcher(self.client)
         self.parser = PlayerStatsParser()
 
-        self.match_html_cache: dict[str, str] = {}
-        self.goals_cache: dict[str, list[tuple[int, str]]] = {}
-        self.player_season_cache: dict[tuple[int, str, str], list[dict]] = {}
+        # Match HTML is dropped as soon as its match is processed; the bound
+        # only matters for prefetched reports that are still queued.
+        self.match_html_cache = BoundedCache(match_html_cache_bytes)
+        # Player-season pages indexed by match_id, held from prefetch until
+        # their (season, player) pair is joined; evicted pages are spilled to
+        # ``spill_dir`` if given, otherwise refetched (from the HTTP response
+        # cache).
+        self.player_season_cache = BoundedCache(player_season_cache_bytes, spill_dir=spill_dir)
 
     def _abs_url(self, href: str) -> str:
         href = (href or "").strip()
@@ -100,11 +123,18 @@ class PlayerStatsScraper:
     def _get_match_html(self, match_id: str, matches_slug: str) -> str:
         if match_id not in self.match_html_cache:
             url = self.match_url.format(matches_slug=matches_slug, match_id=match_id)
-            self.match_html_cache[match_id] = self.client.get(url)
+            self.match_html_cache[match_id] = self.client.get(url, self.match_info[match_id]["season"])
         return self.match_html_cache[match_id]
 
-    def _get_player_season_rows(self, season: int, player_id: str, player_slug: str) -> list[dict]:
-        key = (int(season), str(player_id), str(player_slug))
+    def _index_season_rows(self, stats_rows: list[dict]) -> dict[str, dict]:
+        # First row per match wins, as in the former linear scan.
+        index = {}
+        for s in stats_rows:
+            index.setdefault(self._clean_id(s.get("match_id")), s)
+        return index
+
+    def _get_player_season_index(self, season: int, player_id: str, player_slug: str) -> dict[str, dict]:
+        key = self._player_season_key(season, player_id, player_slug)
 
         if key not in self.player_season_cache:
             url = self.player_stat_url.format(
@@ -113,16 +143,125 @@ class PlayerStatsScraper:
                 season=season,
             )
             html = self.client.get(url)
-            self.player_season_cache[key] = self.parser.parse_player_leistungsdaten(html)
+            self._cache_player_season(key, html)
 
         return self.player_season_cache[key]
 
-    def collect_player_stats(self):
+    def _cache_player_season(self, key: tuple[int, str, str], html: str):
+        # The page length is a cheap stand-in for the size of the parsed index.
+        index = self._index_season_rows(self.parser.parse_player_leistungsdaten(html))
+        self.player_season_cache.put(key, index, size=len(html))
+
+    def _player_season_key(self, season: int, player_id: str, player_slug: str) -> tuple[int, str, str]:
+        return int(season), str(player_id), str(player_slug)
+
+    def _prefetch_match_html(self, batch: list[tuple[str, str]]):
+        todo = [(match_id, slug) for match_id, slug in batch if match_id not in self.match_html_cache]
+        urls = [self.match_url.format(matches_slug=slug, match_id=match_id) for match_id, slug in todo]
+        # Report URLs carry no season; pass it so past-season reports never expire.
+        seasons = [self.match_info[match_id]["season"] for match_id, _slug in todo]
+
+        # Failures are left out of the cache; _get_match_html retries and warns.
+        for (match_id, _slug), (_url, html, e) in zip(todo, self.fetcher.fetch_all(urls, seasons)):
+            if e is None:
+                self.match_html_cache[match_id] = html
+
+    def _prefetch_player_seasons(self, keys):
+        todo = [key for key in dict.fromkeys(keys) if key not in self.player_season_cache]
+        urls = [
+            self.player_stat_url.format(slug=player_slug, player_id=player_id, season=season)
+            for season, player_id, player_slug in todo
+        ]
+
+        # Failures are left out of the cache; _get_player_season_index retries and warns.
+        for key, (_url, html, e) in zip(todo, self.fetcher.fetch_all(urls)):
+            if e is not None:
+                continue
+            try:
+                self._cache_player_season(key, html)
+            except Exception:
+                continue
+
+    def _plan_match(self, match_id: str, matches_slug: str) -> dict | None:
+        """
+        Reduce a match report to what the join needs: the lineup, the goals
+        and the substitution events of each lineup player. Plain JSON, so it
+        can be checkpointed.
+        """
+        try:
+            mh = self._get_match_html(match_id, matches_slug)
+        except Exception as e:
+            print(f"[WARN] match report failed: match_id={match_id}, slug={matches_slug}, error={e}")
+            return None
+        finally:
+            # Each report is read once; free its HTML right away.
+            self.match_html_cache.pop(match_id, None)
+
+        try:
+            report = MatchReport(mh, self.parser, match_id)
+        except Exception as e:
+            print(f"[WARN] lineup parsing failed: match_id={match_id}, error={e}")
+            return None
+
+        if not report.player_refs:
+            print(f"[WARN] no players found in match report: match_id={match_id}")
+            return None
+
+        refs = []
+        subs = {}
+        for p in report.player_refs:
+            player_id = self._clean_id(p.get("player_id"))
+            player_slug = str(p.get("player_slug") or "").strip()
+
+            if not player_id or not player_slug:
+                continue
+
+            refs.append([player_id, player_slug])
+            try:
+                subs[player_id] = [list(ev) for ev in report.sub_events(player_id)]
+            except Exception as e:
+                print(f"[WARN] sub events failed: match_id={match_id}, player_id={player_id}, error={e}")
+                subs[player_id] = []
+
+        return {
+            "match_id": match_id,
+            "season": int(self.match_info[match_id]["season"]),
+            "refs": refs,
+            "goals": [list(g) for g in report.goals],
+            "subs": subs,
+        }
+
+    def collect_player_stats(self, batch_size: int = 32, checkpoint: Checkpoint | None = None):
+        """
+        Player-centric plan:
+
+        1. read every match report once and reduce it to a plan,
+        2. group the lineups into (season, player) pairs,
+        3. fetch each player's season page once and index its rows by match_id,
+        4. join each pair to all of its matches by dictionary lookup.
+        """
         if not hasattr(self, "matches"):
             raise ValueError("Run load_inputs() first.")
 
+        plans = {}
+        pair_matches = {}
+        done = set()
         rows = []
 
+        if checkpoint is not None:
+            results = checkpoint.results()
+            plans = {key[1]: value for key, value in results.items() if key[0] == "plan"}
+            pair_matches = {key[1]: value for key, value in results.items() if key[0] == "pair"}
+            done = checkpoint.done_ids()
+            rows = checkpoint.rows()
+            if plans:
+                print(
+                    f"Resuming player stats from checkpoint: {len(plans)} match plans, "
+                    f"{len(done)} player seasons, {len(rows)} rows"
+                )
+
+        match_order = {}
+        pending = []
         for m in self.matches.itertuples(index=False):
             match_id = self._clean_id(m.match_id)
             matches_slug = str(m.matches_slug).strip()
@@ -130,131 +269,183 @@ class PlayerStatsScraper:
             if not match_id or not matches_slug:
                 continue
 
-            mi = self.match_info[match_id]
-            season = int(mi["season"])
-            home_id = mi["home"]
-            away_id = mi["away"]
-
-            try:
-                mh = self._get_match_html(match_id, matches_slug)
-            except Exception as e:
-                print(f"[WARN] match report failed: match_id={match_id}, slug={matches_slug}, error={e}")
-                continue
-
-            try:
-                player_refs = self.parser.parse_spielbericht_player_refs(mh)
-            except Exception as e:
-                print(f"[WARN] lineup parsing failed: match_id={match_id}, error={e}")
-                continue
+            match_order.setdefault(match_id, len(match_order))
+            if match_id not in plans:
+                pending.append((match_id, matches_slug))
 
-            if not player_refs:
-                print(f"[WARN] no players found in match report: match_id={match_id}")
-                continue
-
-            if match_id not in self.goals_cache:
-                try:
-                    self.goals_cache[match_id] = self.parser.parse_spielbericht_goals(mh)
-                except Exception as e:
-                    print(f"[WARN] goal parsing failed: match_id={match_id}, error={e}")
-                    self.goals_cache[match_id] = []
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            self._prefetch_match_html(batch)
 
-            goals = self.goals_cache[match_id]
+            batch_plans = {}
+            for match_id, matches_slug in batch:
+                plan = self._plan_match(match_id, matches_slug)
+                if plan is not None:
+                    batch_plans[match_id] = plan
 
-            for p in player_refs:
-                player_id = self._clean_id(p.get("player_id"))
-                player_slug = str(p.get("player_slug") or "").strip()
-
-                if not player_id or not player_slug:
-                    continue
+            plans.update(batch_plans)
+            if checkpoint is not None:
+                checkpoint.save({}, {("plan", match_id): plan for match_id, plan in batch_plans.items()})
 
+        matches_by_key: dict[tuple[int, str, str], list[str]] = {}
+        for match_id, plan in plans.items():
+            if match_id not in match_order:
+                continue
+            for player_id, player_slug in plan["refs"]:
+                key = self._player_season_key(plan["season"], player_id, player_slug)
+                matches_by_key.setdefault(key, []).append(match_id)
+
+        # A pair is only done for the matches it was joined with; if the
+        # matches file changed its matches, its rows are dropped and rebuilt.
+        # Pairs that no longer occur in any current match are dropped for good.
+        key_ids = {self._key_id(key): match_ids for key, match_ids in matches_by_key.items()}
+        stale = [
+            key_id for key_id in done
+            if key_id not in key_ids or sorted(pair_matches.get(key_id, [])) != sorted(key_ids[key_id])
+        ]
+        if stale and checkpoint is not None:
+            print(f"Match set changed for {len(stale)} checkpointed player seasons, dropping or rebuilding them")
+            checkpoint.discard(stale)
+            done = checkpoint.done_ids()
+            rows = checkpoint.rows()
+
+        keys = [key for key in matches_by_key if self._key_id(key) not in done]
+        print(f"player stats plan: {len(plans)} matches, {len(matches_by_key)} player seasons, {len(keys)} to fetch")
+
+        failed_matches = set()
+        for start in range(0, len(keys), batch_size):
+            batch = keys[start:start + batch_size]
+            self._prefetch_player_seasons(batch)
+
+            batch_rows = {}
+            batch_pairs = {}
+            for key in batch:
+                season, player_id, player_slug = key
                 try:
-                    stats_rows = self._get_player_season_rows(season, player_id, player_slug)
+                    by_match = self._get_player_season_index(season, player_id, player_slug)
                 except Exception as e:
                     print(
-                        f"[WARN] player stats failed: match_id={match_id}, "
-                        f"player_id={player_id}, season={season}, error={e}"
+                        f"[WARN] player stats failed: player_id={player_id}, season={season}, "
+                        f"matches={len(matches_by_key[key])}, error={e}"
                     )
+                    failed_matches.update(matches_by_key[key])
                     continue
 
-                stat_row = None
-                for s in stats_rows:
-                    stat_match_id = self._clean_id(s.get("match_id"))
-                    if stat_match_id == match_id:
-                        stat_row = s
-                        break
+                key_rows = []
+                for match_id in matches_by_key[key]:
+                    row = self._build_row(plans[match_id], player_id, by_match.get(match_id))
+                    if row is not None:
+                        key_rows.append(row)
+
+                batch_rows[self._key_id(key)] = key_rows
+                batch_pairs[("pair", self._key_id(key))] = sorted(matches_by_key[key])
+                rows.extend(key_rows)
+
+                # Every match of this pair is joined; the page is not needed again.
+                self.player_season_cache.pop(key, None)
+
+            if checkpoint is not None:
+                # Pairs whose page failed are not marked done and are retried on resume.
+                checkpoint.save(batch_rows, batch_pairs)
+
+        # Matches with a plan, at least one row and every player season
+        # joined; the others are incomplete and should be scraped again.
+        planned = {match_id for match_id in plans if match_id in match_order}
+        self.scraped_match_ids = (planned & {r["match_id"] for r in rows}) - failed_matches
+
+        # Restore the match / lineup order of the match-centric loop.
+        lineup_pos = {
+            (match_id, player_id): i
+            for match_id, plan in plans.items()
+            for i, (player_id, _slug) in enumerate(plan["refs"])
+        }
+        rows.sort(key=lambda r: (
+            match_order.get(r["match_id"], len(match_order)),
+            lineup_pos.get((r["match_id"], r["player_id"]), 0),
+        ))
 
-                if stat_row is None:
-                    continue
+        return self._build_player_stats(rows)
 
-                club_id = self._clean_id(stat_row.get("club_id"))
-                if not club_id:
-                    continue
+    def _key_id(self, key: tuple[int, str, str]) -> str:
+        return f"{key[0]}/{key[1]}/{key[2]}"
 
-                if club_id != home_id and club_id != away_id:
-                    continue
+    def _build_row(self, plan: dict, player_id: str, stat_row: dict | None) -> dict | None:
+        if stat_row is None:
+            return None
 
-                minutes_played = stat_row.get("minuten")
-                if minutes_played is None or pd.isna(minutes_played):
-                    continue
+        mi = self.match_info[plan["match_id"]]
+        home_id = mi["home"]
+        away_id = mi["away"]
 
-                try:
-                    minutes_played = int(minutes_played)
-                except (TypeError, ValueError):
-                    continue
+        club_id = self._clean_id(stat_row.get("club_id"))
+        if not club_id:
+            return None
 
-                if minutes_played <= 0:
-                    continue
+        if club_id != home_id and club_id != away_id:
+            return None
 
-                try:
-                    sub_events = self.parser.parse_spielbericht_player_sub_events(mh, player_id)
-                    start_eleven, on_min_eff, off_min_eff, intervals = (
-                        self.parser.derive_start11_onoff_and_intervals(
-                            minutes_played,
-                            sub_events,
-                        )
-                    )
-                except Exception as e:
-                    print(f"[WARN] sub events failed: match_id={match_id}, player_id={player_id}, error={e}")
-                    start_eleven, on_min_eff, off_min_eff, intervals = (
-                        self.parser.derive_start11_onoff_and_intervals(
-                            minutes_played,
-                            [],
-                        )
-                    )
+        minutes_played = stat_row.get("minuten")
+        if minutes_played is None or pd.isna(minutes_played):
+            return None
 
-                on_min_out = None if start_eleven == 1 else int(on_min_eff)
-                off_min_out = None if off_min_eff is None else int(off_min_eff)
+        try:
+            minutes_played = int(minutes_played)
+        except (TypeError, ValueError):
+            return None
 
-                team_goals = sum(
-                    1
-                    for minute, cid in goals
-                    if cid == club_id and self._minute_in_intervals(int(minute), intervals)
+        if minutes_played <= 0:
+            return None
+
+        try:
+            sub_events = [tuple(ev) for ev in plan["subs"].get(player_id, [])]
+            start_eleven, on_min_eff, off_min_eff, intervals = (
+                self.parser.derive_start11_onoff_and_intervals(
+                    minutes_played,
+                    sub_events,
                 )
-                team_conceded = sum(
-                    1
-                    for minute, cid in goals
-                    if cid != club_id and self._minute_in_intervals(int(minute), intervals)
+            )
+        except Exception as e:
+            print(f"[WARN] sub events failed: match_id={plan['match_id']}, player_id={player_id}, error={e}")
+            start_eleven, on_min_eff, off_min_eff, intervals = (
+                self.parser.derive_start11_onoff_and_intervals(
+                    minutes_played,
+                    [],
                 )
+            )
 
-                rows.append(
-                    {
-                        "player_id": player_id,
-                        "match_id": match_id,
-                        "club_id": club_id,
-                        "goals": int(stat_row.get("tore") or 0),
-                        "assists": int(stat_row.get("assists") or 0),
-                        "yellow": int(stat_row.get("gelb") or 0),
-                        "yellow_red": int(stat_row.get("gelb_rot") or 0),
-                        "red": int(stat_row.get("rot") or 0),
-                        "start_eleven": int(start_eleven),
-                        "minutes": minutes_played,
-                        "on_min": on_min_out,
-                        "off_min": off_min_out,
-                        "team_goals": int(team_goals),
-                        "team_conceded": int(team_conceded),
-                    }
-                )
+        on_min_out = None if start_eleven == 1 else int(on_min_eff)
+        off_min_out = None if off_min_eff is None else int(off_min_eff)
+
+        goals = plan["goals"]
+        team_goals = sum(
+            1
+            for minute, cid in goals
+            if cid == club_id and self._minute_in_intervals(int(minute), intervals)
+        )
+        team_conceded = sum(
+            1
+            for minute, cid in goals
+            if cid != club_id and self._minute_in_intervals(int(minute), intervals)
+        )
+
+        return {
+            "player_id": player_id,
+            "match_id": plan["match_id"],
+            "club_id": club_id,
+            "goals": int(stat_row.get("tore") or 0),
+            "assists": int(stat_row.get("assists") or 0),
+            "yellow": int(stat_row.get("gelb") or 0),
+            "yellow_red": int(stat_row.get("gelb_rot") or 0),
+            "red": int(stat_row.get("rot") or 0),
+            "start_eleven": int(start_eleven),
+            "minutes": minutes_played,
+            "on_min": on_min_out,
+            "off_min": off_min_out,
+            "team_goals": int(team_goals),
+            "team_conceded": int(team_conceded),
+        }
 
+    def _build_player_stats(self, rows: list[dict]) -> pd.DataFrame:
         cols = [
             "player_id",
             "match_id",
@@ -291,9 +482,11 @@ class PlayerStatsScraper:
 
         return self.player_stats
 
-    def run(self):
+    def run(self, resume: bool = True):
         self.load_inputs()
-        self.collect_player_stats()
+
+        checkpoint = Checkpoint(self.checkpoint_path) if resume else None
+        self.collect_player_stats(checkpoint=checkpoint)
 
         logger = Logger()
         logger.log(self.player_stats, "player_stats")
@@ -303,6 +496,11 @@ class PlayerStatsScraper:
 
         print(f"player_stats saved to: {self.player_stats_savepath}")
 
+        if checkpoint is not None:
+            checkpoint.clear()
+
+        self.player_season_cache.close()
+
         return self.player_stats
 
 
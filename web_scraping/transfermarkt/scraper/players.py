@@ -3,6 +3,7 @@ import pandas as pd
 
 from web_scraping.transfermarkt.parser.players import PlayersParser
 from web_scraping.transfermarkt.client import HttpClient
+from web_scraping.transfermarkt.fetcher import ConcurrentFetcher
 from web_scraping.toolkit.logger import Logger
 
 
@@ -20,6 +21,7 @@ class PlayersScraper:
         self.squads_savepath = f"data/scrape/{league_type}/squads.csv"
 
         self.client = HttpClient()
+        self.fetcher = ConcurrentFetcher(self.client)
         self.parser = PlayersParser()
 
     def _abs_url(self, href: str) -> str:
@@ -88,6 +90,8 @@ class PlayersScraper:
         total_pages = 0
         not_found_count = 0
 
+        urls = []
+        pages = []
         for row in self.work.itertuples(index=False):
             season = int(row.season)
             club_id = self._clean_id(row.club_id)
@@ -101,10 +105,11 @@ class PlayersScraper:
                 club_id=club_id,
                 season=season,
             )
+            pages.append((season, club_id))
+            urls.append(url)
 
-            try:
-                html = self.client.get(url)
-            except Exception as e:
+        for (season, club_id), (url, html, e) in zip(pages, self.fetcher.fetch_all(urls)):
+            if e is not None:
                 print(f"[WARN] squad page failed: club_id={club_id}, season={season}, url={url}, error={e}")
                 not_found_count += 1
                 continue
@@ -166,10 +171,8 @@ class PlayersScraper:
 
         player_rows = []
 
-        for i, (pid, base) in enumerate(self.base_players.items(), start=1):
-            if i % 100 == 0:
-                print(f"[INFO] Profiles progress: {i}/{total_profiles}")
-
+        urls = {}
+        for pid, base in self.base_players.items():
             url = ""
             if base.get("player_href"):
                 url = self._abs_url(base["player_href"])
@@ -180,6 +183,15 @@ class PlayersScraper:
                     player_id=pid,
                 )
 
+            if url:
+                urls[pid] = url
+
+        fetched = self.fetcher.fetch_all(urls.values())
+
+        for i, (pid, base) in enumerate(self.base_players.items(), start=1):
+            if i % 100 == 0:
+                print(f"[INFO] Profiles progress: {i}/{total_profiles}")
+
             details = {
                 "birth_date": None,
                 "nationality": None,
@@ -188,9 +200,12 @@ class PlayersScraper:
                 "player_slug": None,
             }
 
-            if url:
+            if pid in urls:
+                url, html, e = next(fetched)
                 try:
-                    html = self.client.get(url)
+                    if e is not None:
+                        raise e
+
                     parsed = self.parser.parse_player_profile(html)
                     if parsed:
                         details.update(parsed)